@@ -3,17 +3,51 @@ Zendesk API client module.
 Handles all API communication with Zendesk.
 """
 
+import random
 import threading
 import time
 from typing import Optional, List, Dict, Any
 
 import requests
+from requests.adapters import HTTPAdapter
 from requests.auth import HTTPBasicAuth
 
 from zendesk_dc_manager.config import (
     API_CONFIG,
     logger,
 )
+from zendesk_dc_manager.types import Canceled
+
+
+class RateLimiter:
+    """Thread-safe token bucket shared by all requests of one client.
+
+    Allows short bursts of up to `burst` requests while holding the
+    sustained rate at `rate_per_minute`, so concurrent workers stay under
+    the Zendesk account limit instead of triggering 429 responses.
+    """
+
+    def __init__(self, rate_per_minute: int, burst: int):
+        self._rate = rate_per_minute / 60.0
+        self._capacity = float(burst)
+        self._tokens = float(burst)
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Take one token, sleeping until it is available."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self._capacity, self._tokens + (now - self._last) * self._rate
+            )
+            self._last = now
+            # Reserve the token now (possibly going negative) and sleep
+            # outside the lock so other threads can queue behind us.
+            self._tokens -= 1.0
+            wait = -self._tokens / self._rate if self._tokens < 0 else 0.0
+        if wait > 0:
+            time.sleep(wait)
 
 
 class ZendeskAPI:
@@ -30,11 +64,23 @@ class ZendeskAPI:
             'Content-Type': 'application/json',
             'Accept': 'application/json'
         })
+        # One keep-alive pool shared by every call; sized so the scan and
+        # apply worker threads never have to open throwaway connections.
+        # Retries are handled in _request, so the adapter must not retry.
+        adapter = HTTPAdapter(
+            pool_connections=API_CONFIG.HTTP_POOL_CONNECTIONS,
+            pool_maxsize=API_CONFIG.HTTP_POOL_MAXSIZE,
+            max_retries=0
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
 
         self._stop_flag = False
         self._stop_lock = threading.Lock()
-        self._last_request_time = 0
-        self._request_lock = threading.Lock()
+        self._limiter = RateLimiter(
+            API_CONFIG.RATE_LIMIT_REQUESTS_PER_MINUTE,
+            API_CONFIG.RATE_LIMIT_BURST
+        )
         self.page_callback = None  # Set externally to receive (count) after each page
 
     def stop(self):
@@ -53,14 +99,17 @@ class ZendeskAPI:
             return self._stop_flag
 
     def _rate_limit(self):
-        """Enforce rate limiting between requests."""
-        with self._request_lock:
-            now = time.time()
-            min_interval = 0.1
-            elapsed = now - self._last_request_time
-            if elapsed < min_interval:
-                time.sleep(min_interval - elapsed)
-            self._last_request_time = time.time()
+        """Enforce the shared request rate across all threads."""
+        self._limiter.acquire()
+
+    @staticmethod
+    def _backoff_delay(attempt: int) -> float:
+        """Exponential backoff with jitter for the given retry attempt."""
+        delay = API_CONFIG.RETRY_BASE_DELAY * (
+            API_CONFIG.RETRY_BACKOFF_FACTOR ** attempt
+        )
+        delay = min(delay, API_CONFIG.RETRY_MAX_DELAY)
+        return delay + random.uniform(0, API_CONFIG.RETRY_BASE_DELAY)
 
     def _request(
         self,
@@ -73,16 +122,16 @@ class ZendeskAPI:
     ) -> requests.Response:
         """Make an API request with retry logic."""
         if self._should_stop():
-            raise Exception("Operation canceled")
+            raise Canceled("Operation canceled")
 
         if retries is None:
             retries = API_CONFIG.RETRY_COUNT
 
-        self._rate_limit()
-
         for attempt in range(retries + 1):
             if self._should_stop():
-                raise Exception("Operation canceled")
+                raise Canceled("Operation canceled")
+
+            self._rate_limit()
 
             try:
                 if method.upper() == 'GET':
@@ -126,7 +175,7 @@ class ZendeskAPI:
                     )
                     for _ in range(max(1, retry_after)):
                         if self._should_stop():
-                            raise Exception("Operation canceled")
+                            raise Canceled("Operation canceled")
                         time.sleep(1)
                     continue
 
@@ -142,11 +191,17 @@ class ZendeskAPI:
                 if '404' in str(e) and not retry_on_404:
                     raise
 
+                # Other client errors (e.g. 422 name taken) are not
+                # transient; surface them immediately so callers can react.
+                status = getattr(e.response, 'status_code', None)
+                if status is not None and 400 <= status < 500 and status != 404:
+                    raise
+
                 if attempt < retries:
-                    wait_time = API_CONFIG.RETRY_BASE_DELAY * (attempt + 1)
+                    wait_time = self._backoff_delay(attempt)
                     logger.warning(
                         f"Request failed (attempt {attempt + 1}): {e}. "
-                        f"Retrying in {wait_time}s..."
+                        f"Retrying in {wait_time:.1f}s..."
                     )
                     time.sleep(wait_time)
                 else:
@@ -170,7 +225,7 @@ class ZendeskAPI:
 
         while url and page_count < API_CONFIG.MAX_PAGINATION_PAGES:
             if self._should_stop():
-                raise Exception("Operation canceled")
+                raise Canceled("Operation canceled")
 
             response = self._request(
                 'GET', url, params=params, retry_on_404=retry_on_404
@@ -417,12 +472,14 @@ class ZendeskAPI:
         self,
         field_id: int,
         updates: Dict[str, str]
-    ) -> None:
+    ) -> List[str]:
         """Update multiple ticket field options in a single GET+PUT.
 
         updates: {option_value: new_name}
         More efficient than calling update_ticket_field_option_via_field
         once per option when updating many options on the same field.
+        Returns the option values not present on the field (the PUT is
+        skipped when none of them are).
         """
         field = self.get_ticket_field(field_id)
         options = field.get('custom_field_options', [])
@@ -432,13 +489,17 @@ class ZendeskAPI:
         for opt in options:
             opt_value = opt.get('value')
             if self._should_stop():
-                raise Exception("Operation canceled")
+                raise Canceled("Operation canceled")
             fallback = opt.get('raw_name') or opt.get('name') or ''
             updated.append({
                 'name': updates.get(opt_value, fallback),
                 'value': opt_value,
             })
-        self.update_ticket_field(field_id, {'custom_field_options': updated})
+        present = {opt.get('value') for opt in options}
+        missing = [value for value in updates if value not in present]
+        if len(missing) < len(updates):
+            self.update_ticket_field(field_id, {'custom_field_options': updated})
+        return missing
 
     # =========================================================================
     # TICKET FORMS
@@ -565,8 +626,11 @@ class ZendeskAPI:
         self,
         field_id: int,
         updates: Dict[str, str]
-    ) -> None:
-        """Update multiple user field options in a single GET+PUT."""
+    ) -> List[str]:
+        """Update multiple user field options in a single GET+PUT.
+
+        Returns the option values not present on the field.
+        """
         field = self.get_user_field(field_id)
         options = field.get('custom_field_options', [])
         if not options:
@@ -575,13 +639,17 @@ class ZendeskAPI:
         for opt in options:
             opt_value = opt.get('value')
             if self._should_stop():
-                raise Exception("Operation canceled")
+                raise Canceled("Operation canceled")
             fallback = opt.get('raw_name') or opt.get('name') or ''
             updated.append({
                 'name': updates.get(opt_value, fallback),
                 'value': opt_value,
             })
-        self.update_user_field(field_id, {'custom_field_options': updated})
+        present = {opt.get('value') for opt in options}
+        missing = [value for value in updates if value not in present]
+        if len(missing) < len(updates):
+            self.update_user_field(field_id, {'custom_field_options': updated})
+        return missing
 
     # =========================================================================
     # ORGANIZATION FIELDS
@@ -672,8 +740,11 @@ class ZendeskAPI:
         self,
         field_id: int,
         updates: Dict[str, str]
-    ) -> None:
-        """Update multiple organization field options in a single GET+PUT."""
+    ) -> List[str]:
+        """Update multiple organization field options in a single GET+PUT.
+
+        Returns the option values not present on the field.
+        """
         field = self.get_organization_field(field_id)
         options = field.get('custom_field_options', [])
         if not options:
@@ -682,13 +753,17 @@ class ZendeskAPI:
         for opt in options:
             opt_value = opt.get('value')
             if self._should_stop():
-                raise Exception("Operation canceled")
+                raise Canceled("Operation canceled")
             fallback = opt.get('raw_name') or opt.get('name') or ''
             updated.append({
                 'name': updates.get(opt_value, fallback),
                 'value': opt_value,
             })
-        self.update_organization_field(field_id, {'custom_field_options': updated})
+        present = {opt.get('value') for opt in options}
+        missing = [value for value in updates if value not in present]
+        if len(missing) < len(updates):
+            self.update_organization_field(field_id, {'custom_field_options': updated})
+        return missing
 
     # =========================================================================
     # GROUPS
@@ -14,7 +14,7 @@ import atexit
 from contextlib import contextmanager
 from datetime import datetime, timezone
 from queue import Queue, Empty, Full
-from typing import Optional, Tuple, Set, Generator
+from typing import Optional, Tuple, Set, Generator, Iterable
 
 from zendesk_dc_manager.config import logger
 
@@ -255,6 +255,38 @@ class PersistentCache:
             logger.error(f"Cache write error: {e}")
             return False
 
+    def set_many(self, rows: Iterable[Tuple[str, str, str]]) -> int:
+        """Store many (text, lang, translation) rows in one transaction.
+
+        Returns the number of rows written.
+        """
+        params = [
+            (self._generate_id(text, lang), text, lang, translation)
+            for text, lang, translation in rows
+            if text and translation and lang
+        ]
+        if not params:
+            return 0
+
+        try:
+            with self._get_connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute("BEGIN")
+                try:
+                    cursor.executemany("""
+                        INSERT OR REPLACE INTO translations
+                        (id, original, target_lang, translated_text, created_at, accessed_at)
+                        VALUES (?, ?, ?, ?, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP)
+                    """, params)
+                    cursor.execute("COMMIT")
+                except Exception:
+                    cursor.execute("ROLLBACK")
+                    raise
+                return len(params)
+        except Exception as e:
+            logger.error(f"Cache batch write error: {e}")
+            return 0
+
     def delete(self, text: str, lang: str) -> bool:
         """Delete a specific entry from the cache."""
         if not text or not lang:
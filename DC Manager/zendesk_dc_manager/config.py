@@ -118,9 +118,14 @@ class APIConfig:
     RATE_LIMIT_INITIAL_WAIT: int = 2
     RATE_LIMIT_MAX_WAIT: int = 60
     RATE_LIMIT_BACKOFF_FACTOR: float = 2.0
+    RATE_LIMIT_REQUESTS_PER_MINUTE: int = 600
+    RATE_LIMIT_BURST: int = 10
     THREAD_POOL_SIZE: int = 5
     THREAD_POOL_SIZE_VARIANTS: int = 8
+    HTTP_POOL_CONNECTIONS: int = 16
+    HTTP_POOL_MAXSIZE: int = 32
     MAX_PAGINATION_PAGES: int = 1000
+    DC_CACHE_TTL_SEC: float = 300.0
 
 
 @dataclass(frozen=True)
@@ -132,6 +137,7 @@ class TranslationConfig:
     MIN_TEXT_FOR_PADDING: int = 15
     MIN_TEXT_FOR_PADDING_LOWER: int = 3
     DEFAULT_CACHE_EXPIRY_DAYS: int = 30
+    CACHE_WRITE_BATCH_SIZE: int = 100
 
 
 @dataclass(frozen=True)
@@ -142,8 +148,12 @@ class UIConfig:
     WORKER_STOP_INTERVALS: Tuple[int, ...] = (500, 1000, 2000)
     LOG_INTERVAL: int = 100
     STATUS_UPDATE_INTERVAL_SEC: float = 10.0
+    PROGRESS_EMIT_STEPS: int = 200
+    PROGRESS_EMIT_INTERVAL_SEC: float = 0.1
     SIDEBAR_WIDTH: int = 200
     STATUS_BAR_HEIGHT: int = 55
+    STATUS_TICK_MS: int = 500
+    ETA_SMOOTHING: float = 0.2
     MIN_WINDOW_WIDTH: int = 1100
     MIN_WINDOW_HEIGHT: int = 700
     CARD_MARGIN: int = 20
@@ -160,6 +170,11 @@ class UIConfig:
     TABLE_INSERT_INTERVAL_MS: int = 10
     SCREEN_RATIO: float = 1.0
     TABLE_ROW_HEIGHT: int = 32
+    WILL_TRANSLATE_DEBOUNCE_MS: int = 30
+    FILTER_DEBOUNCE_MS: int = 50
+    SEARCH_DEBOUNCE_MS: int = 200
+    LOG_MAX_BLOCKS: int = 5000
+    LOG_FLUSH_MS: int = 50
 
 
 # ==============================================================================
@@ -181,15 +196,17 @@ VERSION = "49.0"
 
 CREDENTIALS_FILE = "credentials.json"
 
-# Translation source constants
-SOURCE_NEW = "New"
-SOURCE_ZENDESK_DC = "Zendesk DC"
-SOURCE_TRANSLATED = "Translated"
-SOURCE_CACHE = "Cache"
-SOURCE_FAILED = "Failed"
-SOURCE_MANUAL = "Manual"
-SOURCE_ATTENTION = "Attention"
-SOURCE_RESERVED = "Reserved"
+# Translation source constants. Interned so the item dicts share one object
+# per source and == comparisons against these hit the identity fast path.
+# Keep comparing with == (not is): values decoded from JSON are new objects.
+SOURCE_NEW = sys.intern("New")
+SOURCE_ZENDESK_DC = sys.intern("Zendesk DC")
+SOURCE_TRANSLATED = sys.intern("Translated")
+SOURCE_CACHE = sys.intern("Cache")
+SOURCE_FAILED = sys.intern("Failed")
+SOURCE_MANUAL = sys.intern("Manual")
+SOURCE_ATTENTION = sys.intern("Attention")
+SOURCE_RESERVED = sys.intern("Reserved")
 
 
 # ==============================================================================
@@ -3,15 +3,28 @@ Controller module for Zendesk DC Manager.
 Orchestrates API calls, translation, and data processing.
 """
 
+import functools
+import hashlib
+import itertools
 import json
 import os
 import re
 import threading
+import time
 import unicodedata
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
-from typing import Optional, List, Dict, Any, Tuple
+from typing import Optional, List, Dict, Any, Iterable, Tuple
+
+try:
+    import orjson
+except ImportError:
+    # Optional: faster backup serialization; falls back to stdlib json
+    orjson = None
 
 from zendesk_dc_manager.config import (
+    API_CONFIG,
+    UI_CONFIG,
     logger,
     SOURCE_NEW,
     SOURCE_ZENDESK_DC,
@@ -25,13 +38,25 @@ from zendesk_dc_manager.config import (
 )
 from zendesk_dc_manager.api import ZendeskAPI
 from zendesk_dc_manager.translator import TranslationService
-from zendesk_dc_manager.types import TranslationStats, WorkItem
+from zendesk_dc_manager.types import Canceled, TranslationStats, WorkItem
 
 
 DC_PLACEHOLDER_PATTERN = re.compile(r'\{\{dc\.([^}]+)\}\}')
+# Whole-string placeholder match that tolerates surrounding whitespace, so
+# is_dc_placeholder does not need a stripped copy of every value.
+_DC_PLACEHOLDER_FULL_RE = re.compile(r'\s*\{\{dc\.[^}]+\}\}\s*')
 _RE_NON_ALNUM = re.compile(r'[^a-z0-9]+')
 _RE_MULTI_UNDERSCORE = re.compile(r'_+')
 
+# Substrings marking Zendesk-managed ticket fields, matched in one regex
+# pass instead of one substring scan per pattern.
+_SYSTEM_KEY_RE = re.compile('zd_es_approval|zd_automated|zd_resolution')
+_SYSTEM_TITLE_RE = re.compile(
+    'approval status|status de aprovação|resolution type'
+    '|tipo de resolução|tipo de resolucao',
+    re.IGNORECASE,
+)
+
 SYSTEM_FIELD_TYPES = frozenset([
     'subject', 'description', 'status', 'tickettype', 'priority',
     'group', 'assignee', 'custom_status'
@@ -57,6 +82,25 @@ CONTEXT_MAP = {
     'article': 'Help Center',
 }
 
+# Scan config key -> ZendeskAPI getter backing that scan step. The getters
+# are independent list endpoints, so they are prefetched concurrently.
+SCAN_SOURCES = (
+    ('fields', 'get_ticket_fields'),
+    ('forms', 'get_ticket_forms'),
+    ('custom_statuses', 'get_custom_statuses'),
+    ('user_fields', 'get_user_fields'),
+    ('org_fields', 'get_organization_fields'),
+    ('groups', 'get_groups'),
+    ('macros', 'get_macros'),
+    ('triggers', 'get_triggers'),
+    ('automations', 'get_automations'),
+    ('views', 'get_views'),
+    ('sla_policies', 'get_sla_policies'),
+    ('cats', 'get_hc_categories'),
+    ('sects', 'get_hc_sections'),
+    ('arts', 'get_hc_articles'),
+)
+
 TYPE_DISPLAY_MAP = {
     'ticket_field': 'Field',
     'ticket_field_option': 'Field Option',
@@ -77,7 +121,71 @@ TYPE_DISPLAY_MAP = {
     'article': 'Article',
 }
 
+# obj_type -> (context, type_display), filled lazily by _type_labels.
+_TYPE_CACHE: Dict[str, Tuple[str, str]] = {}
+
+
+def _type_labels(obj_type: str) -> Tuple[str, str]:
+    """Return the cached (context, type_display) pair for an object type."""
+    labels = _TYPE_CACHE.get(obj_type)
+    if labels is None:
+        labels = _TYPE_CACHE.setdefault(obj_type, (
+            CONTEXT_MAP.get(obj_type, 'Other'),
+            TYPE_DISPLAY_MAP.get(
+                obj_type, obj_type.replace('_', ' ').title()
+            ),
+        ))
+    return labels
+
+
+def _write_json(filepath: str, data: Any) -> None:
+    """Write data as indented UTF-8 JSON, using orjson when available."""
+    if orjson is not None:
+        with open(filepath, 'wb') as f:
+            f.write(orjson.dumps(
+                data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+            ))
+    else:
+        with open(filepath, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+
+
+def _read_json(filepath: str) -> Any:
+    """Read a JSON file, using orjson when available."""
+    if orjson is not None:
+        with open(filepath, 'rb') as f:
+            return orjson.loads(f.read())
+    with open(filepath, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+class _ProgressThrottle:
+    """Coalesce per-item progress emits for fast apply/restore loops.
+
+    Emits on every total // PROGRESS_EMIT_STEPS items, when
+    PROGRESS_EMIT_INTERVAL_SEC has elapsed, and always on the last item.
+    The label template is only formatted when an emit actually happens.
+    """
+
+    def __init__(self, progress_signal, total: int, template: str):
+        self._signal = progress_signal
+        self._total = total
+        self._template = template
+        self._step = max(1, total // UI_CONFIG.PROGRESS_EMIT_STEPS)
+        self._last_emit = 0.0
+
+    def update(self, done: int) -> None:
+        now = time.monotonic()
+        if (done >= self._total or done % self._step == 0
+                or now - self._last_emit >= UI_CONFIG.PROGRESS_EMIT_INTERVAL_SEC):
+            self._last_emit = now
+            self._signal.emit(
+                done, self._total,
+                self._template.format(done=done, total=self._total)
+            )
 
+
+@functools.lru_cache(maxsize=8192)
 def generate_dc_name(text: str, max_length: int = 50) -> str:
     """
     Generate a valid DC name from text.
@@ -85,6 +193,7 @@ def generate_dc_name(text: str, max_length: int = 50) -> str:
     Returns empty string if text is already a DC placeholder.
     When truncation occurs, appends a 4-char hash suffix to avoid silent
     collisions between long names that share the same prefix.
+    Results are memoized since many items share the same text.
     """
     if not text:
         return ""
@@ -100,7 +209,6 @@ def generate_dc_name(text: str, max_length: int = 50) -> str:
     cleaned = _RE_MULTI_UNDERSCORE.sub('_', cleaned)
 
     if len(cleaned) > max_length:
-        import hashlib
         suffix = hashlib.md5(cleaned.encode()).hexdigest()[:4]
         cleaned = cleaned[:max_length - 5].rstrip('_') + '_' + suffix
 
@@ -122,7 +230,9 @@ def is_dc_placeholder(text: str) -> bool:
     """Check if text is already a DC placeholder."""
     if not text:
         return False
-    return bool(DC_PLACEHOLDER_PATTERN.fullmatch(str(text).strip()))
+    if not isinstance(text, str):
+        text = str(text)
+    return _DC_PLACEHOLDER_FULL_RE.fullmatch(text) is not None
 
 
 def extract_dc_name_from_placeholder(placeholder: str) -> str:
@@ -136,10 +246,51 @@ def extract_dc_name_from_placeholder(placeholder: str) -> str:
 class ZendeskController:
     """Main controller for Zendesk operations."""
 
+    # obj_type -> ZendeskAPI method taking (obj_id, data) for the object
+    _OBJECT_UPDATERS = {
+        'ticket_field': 'update_ticket_field',
+        'ticket_form': 'update_ticket_form',
+        'custom_status': 'update_custom_status',
+        'user_field': 'update_user_field',
+        'organization_field': 'update_organization_field',
+        'group': 'update_group',
+        'macro': 'update_macro',
+        'trigger': 'update_trigger',
+        'automation': 'update_automation',
+        'view': 'update_view',
+        'sla_policy': 'update_sla_policy',
+        'category': 'update_hc_category',
+        'section': 'update_hc_section',
+        'article': 'update_hc_article',
+    }
+
+    # option obj_type -> (parent field type, single-option ZendeskAPI method)
+    _OPTION_UPDATERS = {
+        'ticket_field_option': (
+            'ticket_field', 'update_ticket_field_option_via_field'
+        ),
+        'user_field_option': (
+            'user_field', 'update_user_field_option_via_field'
+        ),
+        'organization_field_option': (
+            'organization_field', 'update_organization_field_option_via_field'
+        ),
+    }
+
+    # parent field type -> batched option ZendeskAPI method
+    _BATCH_OPTION_UPDATERS = {
+        'ticket_field': 'batch_update_ticket_field_options',
+        'user_field': 'batch_update_user_field_options',
+        'organization_field': 'batch_update_organization_field_options',
+    }
+
     def __init__(self):
         self.api: Optional[ZendeskAPI] = None
         self.translator: Optional[TranslationService] = None
         self.work_items: List[WorkItem] = []
+        # Bumped whenever work_items is replaced, so the UI can tell a new
+        # scan from in-place updates.
+        self.work_items_version: int = 0
         self.dc_map: Dict[str, Dict[str, Any]] = {}
         self.dc_name_map: Dict[str, str] = {}
         self.dc_by_name: Dict[str, Dict[str, Any]] = {}
@@ -152,6 +303,21 @@ class ZendeskController:
         # instead of applying them immediately; execute_changes flushes them
         # as batched GET+PUT calls (one per parent field, not one per option).
         self._deferred_option_updates: Optional[Dict] = None
+        # Batch-wide "update existing DC" flag for the running apply.
+        self._force_update: bool = False
+        # Scan endpoint results fetched ahead of time, keyed by API method
+        # name. Filled by _prefetch_scan_sources, consumed by the scanners.
+        self._prefetched: Dict[str, List[Dict]] = {}
+        # Guards the DC lookup maps and deferred option queue while items are
+        # applied concurrently.
+        self._dc_lock = threading.Lock()
+        # Monotonic time of the last DC cache build; the refresh lock keeps
+        # concurrent 422 handlers from each re-fetching the full DC list.
+        self._dc_cache_time: Optional[float] = None
+        self._dc_refresh_lock = threading.Lock()
+        # Per-apply memo of generated DC names keyed by
+        # (parent_name, current_value); many items share the same text.
+        self._dc_name_memo: Dict[Tuple[str, str], str] = {}
 
         self._stop_flag = False
         self._stop_lock = threading.Lock()
@@ -270,6 +436,7 @@ class ZendeskController:
         """Scan Zendesk objects and analyze for DC opportunities."""
         self._reset_stop()
         self.work_items = []
+        self.work_items_version += 1
 
         stats = {
             'valid_fields': 0,
@@ -313,7 +480,12 @@ class ZendeskController:
                 log_signal.emit(f"Warning: Could not fetch DC items: {e}")
 
         if self._should_stop():
-            raise Exception("Canceled by user")
+            raise Canceled()
+
+        self._prefetch_scan_sources(config, progress_signal, log_signal)
+
+        if self._should_stop():
+            raise Canceled()
 
         step = 0
         total_steps = sum(
@@ -346,7 +518,7 @@ class ZendeskController:
             stats['system_excluded'] += system_count
 
         if self._should_stop():
-            raise Exception("Canceled by user")
+            raise Canceled()
 
         if config.get('forms'):
             step += 1
@@ -358,7 +530,7 @@ class ZendeskController:
             )
 
         if self._should_stop():
-            raise Exception("Canceled by user")
+            raise Canceled()
 
         if config.get('custom_statuses'):
             step += 1
@@ -370,7 +542,7 @@ class ZendeskController:
             )
 
         if self._should_stop():
-            raise Exception("Canceled by user")
+            raise Canceled()
 
         if config.get('user_fields'):
             step += 1
@@ -382,7 +554,7 @@ class ZendeskController:
             )
 
         if self._should_stop():
-            raise Exception("Canceled by user")
+            raise Canceled()
 
         if config.get('org_fields'):
             step += 1
@@ -394,7 +566,7 @@ class ZendeskController:
             )
 
         if self._should_stop():
-            raise Exception("Canceled by user")
+            raise Canceled()
 
         if config.get('groups'):
             step += 1
@@ -406,7 +578,7 @@ class ZendeskController:
             )
 
         if self._should_stop():
-            raise Exception("Canceled by user")
+            raise Canceled()
 
         if config.get('macros'):
             step += 1
@@ -418,7 +590,7 @@ class ZendeskController:
             )
 
         if self._should_stop():
-            raise Exception("Canceled by user")
+            raise Canceled()
 
         if config.get('triggers'):
             step += 1
@@ -430,7 +602,7 @@ class ZendeskController:
             )
 
         if self._should_stop():
-            raise Exception("Canceled by user")
+            raise Canceled()
 
         if config.get('automations'):
             step += 1
@@ -442,7 +614,7 @@ class ZendeskController:
             )
 
         if self._should_stop():
-            raise Exception("Canceled by user")
+            raise Canceled()
 
         if config.get('views'):
             step += 1
@@ -454,7 +626,7 @@ class ZendeskController:
             )
 
         if self._should_stop():
-            raise Exception("Canceled by user")
+            raise Canceled()
 
         if config.get('sla_policies'):
             step += 1
@@ -466,7 +638,7 @@ class ZendeskController:
             )
 
         if self._should_stop():
-            raise Exception("Canceled by user")
+            raise Canceled()
 
         if config.get('cats'):
             step += 1
@@ -478,7 +650,7 @@ class ZendeskController:
             )
 
         if self._should_stop():
-            raise Exception("Canceled by user")
+            raise Canceled()
 
         if config.get('sects'):
             step += 1
@@ -490,7 +662,7 @@ class ZendeskController:
             )
 
         if self._should_stop():
-            raise Exception("Canceled by user")
+            raise Canceled()
 
         if config.get('arts'):
             step += 1
@@ -501,20 +673,86 @@ class ZendeskController:
                 log_signal, make_cb(label)
             )
 
+        self._prefetched = {}
         log_signal.emit(f"Scan complete. Found {len(self.work_items)} items.")
         return stats
 
+    def _prefetch_scan_sources(
+        self,
+        config: Dict[str, bool],
+        progress_signal,
+        log_signal
+    ):
+        """Fetch the enabled scan endpoints concurrently.
+
+        Results are stored in self._prefetched. A failed fetch is left out,
+        so the scanner fetches it again and reports the error as usual.
+        Request pacing is still enforced by ZendeskAPI._rate_limit.
+        """
+        self._prefetched = {}
+        names = [name for key, name in SCAN_SOURCES if config.get(key)]
+        if len(names) < 2:
+            return
+
+        total = len(names)
+        log_signal.emit(f"Fetching {total} object types in parallel...")
+        progress_signal.emit(0, total, "Fetching scan data")
+        done = 0
+        with ThreadPoolExecutor(
+            max_workers=API_CONFIG.THREAD_POOL_SIZE
+        ) as executor:
+            futures = {
+                executor.submit(getattr(self.api, name)): name
+                for name in names
+            }
+            for future in as_completed(futures):
+                name = futures[future]
+                try:
+                    self._prefetched[name] = future.result()
+                except Exception as e:
+                    logger.warning(f"Prefetch of {name} failed: {e}")
+                done += 1
+                progress_signal.emit(
+                    done, total, f"Fetching scan data: {done}/{total}"
+                )
+
+    def _fetch_scan_items(self, api_method, progress_callback=None) -> List[Dict]:
+        """Return prefetched items for api_method, or fetch them now."""
+        items = self._prefetched.pop(api_method.__name__, None)
+        if items is not None:
+            return items
+        if progress_callback:
+            self.api.page_callback = lambda n: progress_callback(n, 0, '')
+        try:
+            return api_method()
+        finally:
+            self.api.page_callback = None
+
     def invalidate_dc_cache(self):
         """Clear the DC cache so the next scan re-fetches from the API."""
         self.dc_map = {}
         self.dc_name_map = {}
         self.dc_by_name = {}
+        self._dc_cache_time = None
+
+    def _dc_cache_is_fresh(self) -> bool:
+        """Check whether the DC cache was built within DC_CACHE_TTL_SEC."""
+        return (
+            bool(self.dc_map)
+            and self._dc_cache_time is not None
+            and time.monotonic() - self._dc_cache_time
+            < API_CONFIG.DC_CACHE_TTL_SEC
+        )
 
     def _build_dc_cache(self, dc_items: List[Dict]):
-        """Build DC lookup caches from list of DC items."""
-        self.dc_map = {}
-        self.dc_name_map = {}
-        self.dc_by_name = {}
+        """Build DC lookup caches from list of DC items.
+
+        The maps are built locally and swapped in at the end so concurrent
+        readers never observe a half-built cache.
+        """
+        dc_map = {}
+        dc_name_map = {}
+        dc_by_name = {}
 
         for dc in dc_items:
             dc_id = dc.get('id')
@@ -540,16 +778,22 @@ class ZendeskController:
                 'variants': variants
             }
 
-            self.dc_map[placeholder] = dc_info
+            dc_map[placeholder] = dc_info
 
             dc_name_lower = dc_name.lower()
-            self.dc_name_map[dc_name_lower] = placeholder
-            self.dc_by_name[dc_name_lower] = dc_info
+            dc_name_map[dc_name_lower] = placeholder
+            dc_by_name[dc_name_lower] = dc_info
 
             extracted_name = extract_dc_name_from_placeholder(placeholder)
             if extracted_name:
-                self.dc_name_map[extracted_name.lower()] = placeholder
-                self.dc_by_name[extracted_name.lower()] = dc_info
+                dc_name_map[extracted_name.lower()] = placeholder
+                dc_by_name[extracted_name.lower()] = dc_info
+
+        with self._dc_lock:
+            self.dc_map = dc_map
+            self.dc_name_map = dc_name_map
+            self.dc_by_name = dc_by_name
+            self._dc_cache_time = time.monotonic()
 
     def _find_dc_by_placeholder(self, placeholder: str) -> Optional[Dict]:
         """Find DC info by placeholder."""
@@ -615,15 +859,10 @@ class ZendeskController:
         raw_field = raw_field or f'raw_{name_field}'
         if fallback_name_field and not fallback_raw_field:
             fallback_raw_field = f'raw_{fallback_name_field}'
-        count = 0
+        count: int = 0
         try:
-            if progress_callback:
-                self.api.page_callback = lambda n: progress_callback(n, 0, '')
-            try:
-                items = api_method()
-            finally:
-                self.api.page_callback = None
-            total = len(items)
+            items = self._fetch_scan_items(api_method, progress_callback)
+            total: int = len(items)
             for item in items:
                 if self._should_stop():
                     break
@@ -638,7 +877,10 @@ class ZendeskController:
                 is_system = is_system_func(item) if is_system_func else False
                 extra = extra_func(item) if extra_func else None
 
-                dc_match = DC_PLACEHOLDER_PATTERN.search(str(raw))
+                dc_match = (
+                    DC_PLACEHOLDER_PATTERN.search(raw)
+                    if isinstance(raw, str) else None
+                )
                 kwargs = dict(
                     obj_type=obj_type,
                     obj_id=obj_id,
@@ -674,21 +916,24 @@ class ZendeskController:
 
     def _add_description_work_item(
         self,
-        api_item: Dict,
+        api_item: Dict[str, Any],
         obj_type: str,
         obj_id: int,
         description_key: str,
-        raw_description_key: str,
+        raw_description_key: Optional[str],
         is_system: bool,
-        extra: Dict,
-    ):
+        extra: Optional[Dict[str, Any]],
+    ) -> None:
         """Add a work item for a description field if the value is non-empty."""
         raw_key = raw_description_key or f'raw_{description_key}'
         desc = api_item.get(description_key, '') or ''
         raw_desc = api_item.get(raw_key, '') or desc
         if not desc.strip():
             return
-        dc_match = DC_PLACEHOLDER_PATTERN.search(str(raw_desc))
+        dc_match = (
+            DC_PLACEHOLDER_PATTERN.search(raw_desc)
+            if isinstance(raw_desc, str) else None
+        )
         kwargs = dict(
             obj_type=obj_type,
             obj_id=obj_id,
@@ -730,16 +975,11 @@ class ZendeskController:
         Returns:
             Tuple of (field_count, system_field_count)
         """
-        count = 0
-        system_count = 0
+        count: int = 0
+        system_count: int = 0
         try:
-            if progress_callback:
-                self.api.page_callback = lambda n: progress_callback(n, 0, '')
-            try:
-                fields = api_method()
-            finally:
-                self.api.page_callback = None
-            total = len(fields)
+            fields = self._fetch_scan_items(api_method, progress_callback)
+            total: int = len(fields)
             for field in fields:
                 if self._should_stop():
                     break
@@ -757,7 +997,10 @@ class ZendeskController:
                 field_extra = (
                     field_extra_func(field) if field_extra_func else None
                 )
-                dc_match = DC_PLACEHOLDER_PATTERN.search(str(raw_title))
+                dc_match = (
+                    DC_PLACEHOLDER_PATTERN.search(raw_title)
+                    if isinstance(raw_title, str) else None
+                )
                 kwargs = dict(
                     obj_type=field_type,
                     obj_id=field_id,
@@ -808,7 +1051,10 @@ class ZendeskController:
                     # a namespaced DC name: {parent_name}_{option_name}
                     opt_extra['parent_name'] = title
 
-                    dc_match = DC_PLACEHOLDER_PATTERN.search(str(opt_raw))
+                    dc_match = (
+                        DC_PLACEHOLDER_PATTERN.search(opt_raw)
+                        if isinstance(opt_raw, str) else None
+                    )
                     opt_kwargs = dict(
                         obj_type=option_type,
                         obj_id=opt_id,
@@ -845,16 +1091,6 @@ class ZendeskController:
             'zd_resolution_type',
             'zd_automated_resolution',
         ])
-        SYSTEM_KEY_PATTERNS = [
-            'zd_es_approval',
-            'zd_automated',
-            'zd_resolution',
-        ]
-        SYSTEM_TITLE_PATTERNS = [
-            'approval status', 'status de aprovação',
-            'resolution type', 'tipo de resolução', 'tipo de resolucao',
-        ]
-
         def is_system(field):
             field_type = field.get('type', '')
             field_key = field.get('key', '')
@@ -873,13 +1109,13 @@ class ZendeskController:
                         f"(type={field_type}, key={field_key})"
                     )
                     return True
-                if any(p in fk for p in SYSTEM_KEY_PATTERNS):
+                if _SYSTEM_KEY_RE.search(fk):
                     logger.debug(
                         f"System field: {field.get('id')} - {title} "
                         f"(type={field_type}, key={field_key})"
                     )
                     return True
-            if any(p in title.lower() for p in SYSTEM_TITLE_PATTERNS):
+            if _SYSTEM_TITLE_RE.search(title):
                 logger.debug(
                     f"System field: {field.get('id')} - {title} "
                     f"(type={field_type}, key={field_key})"
@@ -1095,24 +1331,24 @@ class ZendeskController:
         field_name: str,
         current_value: str,
         raw_value: str,
-        dc_placeholder: str = None,
-        dc_info: Dict = None,
-        parent_id: int = None,
+        dc_placeholder: Optional[str] = None,
+        dc_info: Optional[Dict[str, Any]] = None,
+        parent_id: Optional[int] = None,
         is_system: bool = False,
-        extra: Dict = None
-    ):
+        extra: Optional[Dict[str, Any]] = None
+    ) -> None:
         """Add a work item to the list."""
-        action = 'CREATE'
-        dc_id = None
-        pt_text = current_value
-        en_text = ''
-        es_text = ''
-        source = SOURCE_NEW
-        placeholder_source = 'proposed'
-        already_linked = False
-        needs_locale_fix = False
-
-        raw_is_dc = is_dc_placeholder(raw_value)
+        action: str = 'CREATE'
+        dc_id: Optional[int] = None
+        pt_text: str = current_value
+        en_text: str = ''
+        es_text: str = ''
+        source: str = SOURCE_NEW
+        placeholder_source: str = 'proposed'
+        already_linked: bool = False
+        needs_locale_fix: bool = False
+
+        raw_is_dc: bool = is_dc_placeholder(raw_value)
 
         if raw_is_dc and dc_info:
             # Field is linked to DC and we found the DC in our cache
@@ -1198,10 +1434,7 @@ class ZendeskController:
                 else:
                     dc_placeholder = generate_dc_placeholder(current_value)
 
-        context = CONTEXT_MAP.get(obj_type, 'Other')
-        type_name = TYPE_DISPLAY_MAP.get(
-            obj_type, obj_type.replace('_', ' ').title()
-        )
+        context, type_name = _type_labels(obj_type)
 
         item = {
             'type': obj_type,
@@ -1241,23 +1474,70 @@ class ZendeskController:
 
         self.work_items.append(item)
 
-    def update_work_item(self, index: int, updates: Dict[str, Any]):
-        """Update a work item at the given index."""
-        if 0 <= index < len(self.work_items):
-            self.work_items[index].update(updates)
-
     # =========================================================================
     # TRANSLATION
     # =========================================================================
 
+    def _select_items_to_translate(
+        self,
+        log_signal,
+        indices,
+        force_retranslate: bool = False,
+    ) -> List[Tuple[int, Dict, bool, bool]]:
+        """Prefilter work items for translation.
+
+        Returns (index, item, needs_en, needs_es) tuples for the items that
+        actually need work, so the translate loop does no further checks.
+        """
+        work_items = self.work_items
+        n_items = len(work_items)
+        to_translate = []
+        system_skipped = 0
+        already_done = 0
+
+        for idx in indices:
+            if idx >= n_items or work_items[idx].get('is_system', False):
+                system_skipped += 1
+                continue
+            item = work_items[idx]
+            if not item.get('pt'):
+                continue
+            needs_en = (
+                force_retranslate or item.get('en_source') == SOURCE_NEW
+                or not item.get('en')
+            )
+            needs_es = (
+                force_retranslate or item.get('es_source') == SOURCE_NEW
+                or not item.get('es')
+            )
+            if needs_en or needs_es:
+                to_translate.append((idx, item, needs_en, needs_es))
+            else:
+                already_done += 1
+
+        if system_skipped > 0:
+            log_signal.emit(f"Skipping {system_skipped} system/reserved items")
+        if force_retranslate:
+            log_signal.emit(
+                f"[RE-TRANSLATE] Processing {len(to_translate)} selected items"
+            )
+        elif already_done > 0:
+            log_signal.emit(
+                f"Skipping {already_done} items that already have "
+                f"translations"
+            )
+        return to_translate
+
     def _translate_items_list(
         self,
         log_signal,
         progress_signal,
-        items_to_translate: List[Tuple[int, Dict]],
-        force_retranslate: bool = False,
+        items_to_translate: List[Tuple[int, Dict, bool, bool]],
     ) -> TranslationStats:
-        """Translate a list of (index, item) pairs. Updates work_items in-place."""
+        """Translate prefiltered (index, item, needs_en, needs_es) tuples.
+
+        Updates work_items in-place.
+        """
         stats = TranslationStats()
         total = len(items_to_translate)
         stats.total = total
@@ -1268,32 +1548,38 @@ class ZendeskController:
 
         log_signal.emit(f"Translating {total} items...")
 
-        for i, (idx, item) in enumerate(items_to_translate):
+        try:
+            self._translate_queue(
+                log_signal, progress_signal, items_to_translate, stats
+            )
+        finally:
+            self.translator.flush_cache()
+
+        log_signal.emit(
+            f"Translation complete: {stats.translated} translated, "
+            f"{stats.from_cache} from cache, {stats.failed} failed"
+        )
+        return stats
+
+    def _translate_queue(
+        self,
+        log_signal,
+        progress_signal,
+        items_to_translate: List[Tuple[int, Dict, bool, bool]],
+        stats: TranslationStats,
+    ) -> None:
+        """Run the translate loop, accumulating counts into stats."""
+        total = len(items_to_translate)
+        for i, (idx, item, needs_en, needs_es) in enumerate(items_to_translate):
             if self._should_stop():
                 log_signal.emit("Translation canceled by user")
-                raise Exception("Canceled by user")
+                raise Canceled()
 
             progress_signal.emit(
                 i + 1, total, f"Translating {i + 1}/{total}..."
             )
 
-            pt_text = item.get('pt', '')
-            if not pt_text:
-                continue
-
-            en_source = item.get('en_source', SOURCE_NEW)
-            es_source = item.get('es_source', SOURCE_NEW)
-            needs_en = (
-                force_retranslate or en_source == SOURCE_NEW
-                or not item.get('en')
-            )
-            needs_es = (
-                force_retranslate or es_source == SOURCE_NEW
-                or not item.get('es')
-            )
-
-            if not needs_en and not needs_es:
-                continue
+            pt_text = item['pt']
 
             try:
                 if needs_en:
@@ -1301,17 +1587,17 @@ class ZendeskController:
                         pt_text, 'pt', 'en'
                     )
                     if en_result:
-                        self.work_items[idx]['en'] = en_result
+                        item['en'] = en_result
                         if en_attention or en_result.strip().lower() == pt_text.strip().lower():
-                            self.work_items[idx]['en_source'] = SOURCE_ATTENTION
+                            item['en_source'] = SOURCE_ATTENTION
                         elif en_from_cache:
-                            self.work_items[idx]['en_source'] = SOURCE_CACHE
+                            item['en_source'] = SOURCE_CACHE
                             stats.from_cache += 1
                         else:
-                            self.work_items[idx]['en_source'] = SOURCE_TRANSLATED
+                            item['en_source'] = SOURCE_TRANSLATED
                             stats.translated += 1
                     else:
-                        self.work_items[idx]['en_source'] = SOURCE_FAILED
+                        item['en_source'] = SOURCE_FAILED
                         stats.failed += 1
 
                 if needs_es:
@@ -1319,31 +1605,25 @@ class ZendeskController:
                         pt_text, 'pt', 'es'
                     )
                     if es_result:
-                        self.work_items[idx]['es'] = es_result
+                        item['es'] = es_result
                         if es_attention or es_result.strip().lower() == pt_text.strip().lower():
-                            self.work_items[idx]['es_source'] = SOURCE_ATTENTION
+                            item['es_source'] = SOURCE_ATTENTION
                         elif es_from_cache:
-                            self.work_items[idx]['es_source'] = SOURCE_CACHE
+                            item['es_source'] = SOURCE_CACHE
                             stats.from_cache += 1
                         else:
-                            self.work_items[idx]['es_source'] = SOURCE_TRANSLATED
+                            item['es_source'] = SOURCE_TRANSLATED
                             stats.translated += 1
                     else:
-                        self.work_items[idx]['es_source'] = SOURCE_FAILED
+                        item['es_source'] = SOURCE_FAILED
                         stats.failed += 1
 
             except Exception as e:
                 logger.error(f"Translation error for item {idx}: {e}")
-                self.work_items[idx]['en_source'] = SOURCE_FAILED
-                self.work_items[idx]['es_source'] = SOURCE_FAILED
+                item['en_source'] = SOURCE_FAILED
+                item['es_source'] = SOURCE_FAILED
                 stats.failed += 1
 
-        log_signal.emit(
-            f"Translation complete: {stats.translated} translated, "
-            f"{stats.from_cache} from cache, {stats.failed} failed"
-        )
-        return stats
-
     def perform_translation(
         self,
         progress_signal,
@@ -1351,30 +1631,13 @@ class ZendeskController:
         force: bool = False
     ) -> TranslationStats:
         """Perform translation for all work items."""
-        self._reset_stop()
-
-        if not self.translator:
-            self.translator = TranslationService()
-
-        total = len(self.work_items)
-        log_signal.emit(f"Starting translation of {total} items...")
-
-        items_to_translate = [
-            (i, item) for i, item in enumerate(self.work_items)
-            if not item.get('is_system')
-            and item.get('pt')
-            and (
-                force
-                or item.get('en_source') == SOURCE_NEW or not item.get('en')
-                or item.get('es_source') == SOURCE_NEW or not item.get('es')
-            )
-        ]
-
-        stats = self._translate_items_list(
-            log_signal, progress_signal, items_to_translate,
+        log_signal.emit(
+            f"Starting translation of {len(self.work_items)} items..."
+        )
+        return self.perform_translation_for_indices(
+            progress_signal, log_signal, range(len(self.work_items)),
             force_retranslate=force,
         )
-        return stats
 
     def perform_translation_for_indices(
         self,
@@ -1389,48 +1652,27 @@ class ZendeskController:
         if not self.translator:
             self.translator = TranslationService()
 
-        items_to_consider = [
-            (idx, self.work_items[idx])
-            for idx in selected_indices
-            if idx < len(self.work_items)
-            and not self.work_items[idx].get('is_system', False)
-        ]
-
-        system_skipped = len(selected_indices) - len(items_to_consider)
-        if system_skipped > 0:
-            log_signal.emit(f"Skipping {system_skipped} system/reserved items")
-
-        if force_retranslate:
-            to_translate = items_to_consider
-            log_signal.emit(
-                f"[RE-TRANSLATE] Processing {len(to_translate)} selected items"
-            )
-        else:
-            to_translate = [
-                (idx, item) for idx, item in items_to_consider
-                if (not item.get('en') or item.get('en_source') == SOURCE_NEW)
-                or (not item.get('es') or item.get('es_source') == SOURCE_NEW)
-            ]
-            already_done = len(items_to_consider) - len(to_translate)
-            if already_done > 0:
-                log_signal.emit(
-                    f"Skipping {already_done} items that already have "
-                    f"translations"
-                )
-
+        to_translate = self._select_items_to_translate(
+            log_signal, selected_indices, force_retranslate
+        )
         return self._translate_items_list(
-            log_signal, progress_signal, to_translate,
-            force_retranslate=force_retranslate,
+            log_signal, progress_signal, to_translate
         )
 
     def execute_changes(
         self,
         items: List[Dict[str, Any]],
         progress_signal,
-        log_signal
+        log_signal,
+        force_update: bool = False
     ) -> Dict[str, Any]:
-        """Execute changes to Zendesk."""
+        """Execute changes to Zendesk.
+
+        Items are read in place (the preview's own dicts); force_update
+        applies to the whole batch instead of being stamped on each item.
+        """
         self._reset_stop()
+        self._force_update = force_update
 
         result = {
             'success': [],
@@ -1439,9 +1681,19 @@ class ZendeskController:
             'backup_file': ''
         }
 
+        backup_thread = None
         if self.backup_folder:
-            backup_file = self._create_backup(items, log_signal)
-            result['backup_file'] = backup_file
+            # Snapshot the items before the apply mutates them (dc_id,
+            # already_linked); the JSON write then runs alongside the apply.
+            snapshot = [dict(item) for item in items]
+
+            def write_backup():
+                result['backup_file'] = self._create_backup(
+                    snapshot, log_signal
+                )
+
+            backup_thread = threading.Thread(target=write_backup, daemon=True)
+            backup_thread.start()
         else:
             log_signal.emit(
                 "Warning: No backup folder configured. "
@@ -1449,7 +1701,29 @@ class ZendeskController:
                 "Set a backup path in the Config tab to enable backups."
             )
 
-        if self.dc_map:
+        try:
+            self._apply_all(items, progress_signal, log_signal, result)
+        finally:
+            if backup_thread is not None:
+                backup_thread.join()
+
+        skipped_count = len(result['skipped'])
+        log_signal.emit(
+            f"Apply complete: {len(result['success'])} succeeded, "
+            f"{len(result['failed'])} failed, {skipped_count} skipped"
+        )
+
+        return result
+
+    def _apply_all(
+        self,
+        items: List[Dict[str, Any]],
+        progress_signal,
+        log_signal,
+        result: Dict[str, Any]
+    ) -> None:
+        """Fetch DCs if needed, then apply items phase by phase."""
+        if self._dc_cache_is_fresh():
             log_signal.emit(
                 f"Using cached DC items ({len(self.dc_map)} items)"
             )
@@ -1457,24 +1731,179 @@ class ZendeskController:
             log_signal.emit("Fetching Dynamic Content list...")
             self._refresh_dc_cache()
 
-        sorted_items = self._sort_items_for_apply(items)
+        self._dc_name_memo = {}
+        total = len(items)
+        skipped, parents, options = self._split_items_for_apply(items)
+        result['skipped'].extend(skipped)
+
+        done = len(skipped)
+        if done:
+            log_signal.emit(f"Skipping {done} items already linked to DC")
+            progress_signal.emit(done, total, f"Applying {done}/{total}...")
+
+        self._precreate_dynamic_content(
+            itertools.chain(parents, options), log_signal
+        )
+
+        if self._should_stop():
+            log_signal.emit("Apply canceled by user")
+            raise Canceled()
 
-        total = len(sorted_items)
-        log_signal.emit(f"Applying {total} changes to Zendesk...")
+        log_signal.emit(
+            f"Applying {len(parents) + len(options)} changes to Zendesk..."
+        )
 
+        # Parent objects are linked before any field options; items within
+        # each phase are independent and applied concurrently.
         self._deferred_option_updates = {}
         try:
-            for i, item in enumerate(sorted_items):
-                if self._should_stop():
-                    log_signal.emit("Apply canceled by user")
-                    raise Exception("Canceled by user")
+            done = self._apply_items_concurrently(
+                parents, done, total, progress_signal, log_signal, result
+            )
+            self._apply_items_concurrently(
+                options, done, total, progress_signal, log_signal, result
+            )
+
+            self._flush_deferred_option_updates(log_signal, result)
+        finally:
+            self._deferred_option_updates = None
+
+    def _dc_name_for_item(self, item: Dict[str, Any]) -> str:
+        """Return the DC name an unlinked item would be created under.
+
+        Field options are prefixed with the parent field name so the DC
+        name is unique and self-documenting: {field}_{option}
+        """
+        current_value = item.get('current_value', item.get('pt', ''))
+        parent_name = (
+            item.get('parent_name', '') or ''
+            if '_option' in item.get('type', '') else ''
+        )
+        key = (parent_name, current_value)
+        name = self._dc_name_memo.get(key)
+        if name is None:
+            option_dc = generate_dc_name(current_value)
+            parent_dc = generate_dc_name(parent_name) if parent_name else ''
+            name = (
+                f"{parent_dc}_{option_dc}" if parent_dc and option_dc
+                else option_dc
+            )
+            self._dc_name_memo[key] = name
+        return name
+
+    def _create_dc_for_item(
+        self,
+        name: str,
+        item: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Create a DC item from a work item's texts and register it."""
+        dc_item = self.api.create_dynamic_content(
+            name=name,
+            default_locale_id=self.pt_locale_id,
+            variants=[
+                {
+                    'locale_id': self.pt_locale_id,
+                    'content': item.get('pt', ''),
+                    'default': True
+                },
+                {'locale_id': self.en_locale_id, 'content': item.get('en', '')},
+                {'locale_id': self.es_locale_id, 'content': item.get('es', '')},
+            ]
+        )
+        if dc_item:
+            placeholder = dc_item.get('placeholder', '')
+            dc_info = {
+                'id': dc_item.get('id'),
+                'name': name,
+                'placeholder': placeholder,
+                'variants': {}
+            }
+            with self._dc_lock:
+                self.dc_map[placeholder] = dc_info
+                self.dc_by_name[name.lower()] = dc_info
+                self.dc_name_map[name.lower()] = placeholder
+        return dc_item
+
+    def _precreate_dynamic_content(
+        self,
+        items: Iterable[Dict[str, Any]],
+        log_signal
+    ) -> None:
+        """Create every DC the batch needs before linking objects to them.
+
+        Zendesk has no bulk create endpoint for dynamic content, so this
+        deduplicates by DC name (one POST per unique name instead of one per
+        item and no duplicate-name 422s between workers) and runs the creates
+        concurrently. Items whose create fails here are retried, and report
+        their error, in the regular apply pass.
+        """
+        pending: Dict[str, Tuple[str, Dict[str, Any]]] = {}
+        for item in items:
+            if item.get('already_linked') or self._force_update:
+                continue
+            if is_dc_placeholder(item.get('raw_value', '')):
+                continue
+            name = self._dc_name_for_item(item)
+            key = name.lower()
+            if not name or key in pending or self._find_dc_by_name(name):
+                continue
+            pending[key] = (name, item)
 
-                progress_signal.emit(i + 1, total, f"Applying {i + 1}/{total}...")
+        if not pending:
+            return
 
+        log_signal.emit(f"Creating {len(pending)} Dynamic Content items...")
+        created = 0
+        with ThreadPoolExecutor(
+            max_workers=API_CONFIG.THREAD_POOL_SIZE
+        ) as executor:
+            futures = {
+                executor.submit(self._create_dc_for_item, name, item): name
+                for name, item in pending.values()
+            }
+            for future in as_completed(futures):
                 try:
-                    success, skipped, msg = self._apply_single_item(
-                        item, log_signal
+                    if future.result():
+                        created += 1
+                except Exception as e:
+                    logger.warning(
+                        f"Could not pre-create DC {futures[future]}: {e}"
                     )
+        log_signal.emit(f"Created {created} Dynamic Content items")
+
+    def _apply_items_concurrently(
+        self,
+        items: List[Dict[str, Any]],
+        done: int,
+        total: int,
+        progress_signal,
+        log_signal,
+        result: Dict[str, Any]
+    ) -> int:
+        """Apply items on a bounded thread pool.
+
+        Progress and result bookkeeping stay on the calling thread as
+        futures complete. Returns the updated count of processed items.
+        """
+        if not items:
+            return done
+
+        progress = _ProgressThrottle(
+            progress_signal, total, "Applying {done}/{total}..."
+        )
+        executor = ThreadPoolExecutor(max_workers=API_CONFIG.THREAD_POOL_SIZE)
+        try:
+            futures = {
+                executor.submit(self._apply_single_item, item, log_signal): item
+                for item in items
+            }
+            for future in as_completed(futures):
+                item = futures[future]
+                done += 1
+                progress.update(done)
+
+                try:
+                    success, skipped, msg = future.result()
                     if skipped:
                         result['skipped'].append(item)
                     elif success:
@@ -1486,20 +1915,30 @@ class ZendeskController:
                     result['failed'].append(item)
                     log_signal.emit(f"    Error: {e}")
 
-            self._flush_deferred_option_updates(log_signal, result)
+                if self._should_stop():
+                    log_signal.emit("Apply canceled by user")
+                    raise Canceled()
         finally:
-            self._deferred_option_updates = None
+            executor.shutdown(wait=True, cancel_futures=True)
 
-        skipped_count = len(result['skipped'])
-        if skipped_count > 0:
-            log_signal.emit(f"Skipped {skipped_count} already-linked items")
-
-        log_signal.emit(
-            f"Apply complete: {len(result['success'])} succeeded, "
-            f"{len(result['failed'])} failed, {skipped_count} skipped"
-        )
+        return done
 
-        return result
+    def _queue_option_update(
+        self,
+        field_type: str,
+        parent_id: int,
+        option_value: str,
+        placeholder: str,
+        item: Optional[Dict[str, Any]]
+    ):
+        """Queue a field option update for the batched flush."""
+        with self._dc_lock:
+            entry = self._deferred_option_updates.setdefault(
+                (field_type, parent_id), {'updates': {}, 'items': []}
+            )
+            entry['updates'][option_value] = placeholder
+            if item is not None:
+                entry['items'].append(item)
 
     def _flush_deferred_option_updates(
         self,
@@ -1512,10 +1951,13 @@ class ZendeskController:
             {(field_type, parent_id): {'updates': {value: placeholder}, 'items': [...]}}
 
         On failure the associated items are moved from result['success'] to
-        result['failed'] so the final report is accurate.
+        result['failed'] so the final report is accurate. The same happens
+        to items whose option value no longer exists on the live field, as
+        the per-option update path reports them.
         """
         if not self._deferred_option_updates:
             return
+        failed_ids = set()
         for (field_type, parent_id), entry in self._deferred_option_updates.items():
             if self._should_stop():
                 break
@@ -1526,56 +1968,85 @@ class ZendeskController:
                     f"  Batch updating {len(updates)} options "
                     f"for {field_type} {parent_id}..."
                 )
-                if field_type == 'ticket_field':
-                    self.api.batch_update_ticket_field_options(parent_id, updates)
-                elif field_type == 'user_field':
-                    self.api.batch_update_user_field_options(parent_id, updates)
-                elif field_type == 'organization_field':
-                    self.api.batch_update_organization_field_options(parent_id, updates)
+                missing = getattr(
+                    self.api, self._BATCH_OPTION_UPDATERS[field_type]
+                )(parent_id, updates)
             except Exception as e:
                 logger.error(f"Batch option update failed for {field_type} {parent_id}: {e}")
                 log_signal.emit(
                     f"  Error batching options for {field_type} {parent_id}: {e}"
                 )
-                # Move prematurely-counted successes to failed.
-                # Use identity set to avoid O(n²) list.remove() and handle
-                # items not found in success (DC created but link failed).
-                queued_ids = {id(i) for i in queued_items}
-                result['success'] = [
-                    i for i in result['success'] if id(i) not in queued_ids
-                ]
+                failed_ids.update(id(i) for i in queued_items)
                 result['failed'].extend(queued_items)
+                continue
 
-    def _refresh_dc_cache(self):
-        """Refresh the DC cache from Zendesk."""
-        try:
-            dc_items = self.api.get_dynamic_content_items()
-            self._build_dc_cache(dc_items)
-        except Exception as e:
-            logger.error(f"Error refreshing DC cache: {e}")
+            if missing:
+                missing = set(missing)
+                for value in sorted(missing):
+                    log_signal.emit(
+                        f"    Error: Option with value '{value}' not found "
+                        f"in {field_type} {parent_id}"
+                    )
+                not_found = [
+                    i for i in queued_items
+                    if i.get('option_value', '') in missing
+                ]
+                failed_ids.update(id(i) for i in not_found)
+                result['failed'].extend(not_found)
+
+        if failed_ids:
+            # Move prematurely-counted successes to failed in one pass over
+            # result['success'], however many fields failed. Identity
+            # matching also handles items never counted as a success
+            # (DC created but link failed).
+            result['success'] = [
+                i for i in result['success'] if id(i) not in failed_ids
+            ]
+
+    def _refresh_dc_cache(self, since: Optional[float] = None):
+        """Refresh the DC cache from Zendesk.
+
+        When since is given, the fetch is skipped if the cache was already
+        rebuilt (e.g. by another worker) at or after that monotonic time.
+        """
+        with self._dc_refresh_lock:
+            if (since is not None and self._dc_cache_time is not None
+                    and self._dc_cache_time >= since):
+                return
+            try:
+                dc_items = self.api.get_dynamic_content_items()
+                self._build_dc_cache(dc_items)
+            except Exception as e:
+                logger.error(f"Error refreshing DC cache: {e}")
 
-    def _sort_items_for_apply(
+    def _split_items_for_apply(
         self,
         items: List[Dict[str, Any]]
-    ) -> List[Dict[str, Any]]:
-        """Sort items for optimal apply order.
-
-        already_linked items are skipped first, then parent fields are created
-        before their child options to avoid ordering issues.
+    ) -> Tuple[
+        List[Dict[str, Any]], List[Dict[str, Any]], List[Dict[str, Any]]
+    ]:
+        """Bucket items into apply phases in a single pass.
+
+        Returns (skipped, parents, options). Items already pointing at a DC
+        have nothing to apply unless a translation update was forced; parent
+        fields are applied before their child options to avoid ordering
+        issues.
         """
-        already_linked = []
-        options = []
+        skipped = []
         parents = []
+        options = []
 
         for item in items:
-            if item.get('already_linked', False):
-                already_linked.append(item)
-            elif '_option' in item.get('type', ''):
-                options.append(item)
-            else:
+            if (is_dc_placeholder(item.get('raw_value', ''))
+                    and not (item.get('dc_id') and self._force_update)):
+                skipped.append(item)
+            elif (item.get('already_linked')
+                    or '_option' not in item.get('type', '')):
                 parents.append(item)
+            else:
+                options.append(item)
 
-        return already_linked + parents + options
+        return skipped, parents, options
 
     def _apply_single_item(
         self,
@@ -1588,16 +2059,14 @@ class ZendeskController:
         pt_text = item.get('pt', '')
         en_text = item.get('en', '')
         es_text = item.get('es', '')
-        force_update = item.get('force_update', False)
+        force_update = self._force_update
         current_value = item.get('current_value', pt_text)
         raw_value = item.get('raw_value', '')
         parent_id = item.get('parent_id')
         option_value = item.get('option_value', '')
 
         _log_value = raw_value if is_dc_placeholder(raw_value) else current_value
-        log_signal.emit(
-            f"  Processing {obj_type} {obj_id}: {_log_value[:80]}..."
-        )
+        logger.debug(f"Processing {obj_type} {obj_id}: {_log_value[:80]}...")
 
         # Debug logging for options
         if '_option' in obj_type:
@@ -1633,19 +2102,7 @@ class ZendeskController:
                     return True, True, "Already linked"
 
             # Not linked yet - need to create or find DC
-            # For field options, prefix with the parent field name so the DC
-            # name is unique and self-documenting: {field}_{option}
-            if '_option' in obj_type:
-                parent_name = item.get('parent_name', '')
-                parent_dc = generate_dc_name(parent_name) if parent_name else ''
-                option_dc = generate_dc_name(current_value)
-                safe_dc_name = (
-                    f"{parent_dc}_{option_dc}"
-                    if parent_dc and option_dc
-                    else option_dc
-                )
-            else:
-                safe_dc_name = generate_dc_name(current_value)
+            safe_dc_name = self._dc_name_for_item(item)
 
             if not safe_dc_name:
                 log_signal.emit("    Cannot generate DC name (skipped)")
@@ -1701,42 +2158,20 @@ class ZendeskController:
                     log_signal.emit(f"    Updated existing DC: {placeholder}")
             else:
                 # Create new DC
+                create_started = time.monotonic()
                 try:
-                    dc_item = self.api.create_dynamic_content(
-                        name=safe_dc_name,
-                        default_locale_id=self.pt_locale_id,
-                        variants=[
-                            {
-                                'locale_id': self.pt_locale_id,
-                                'content': pt_text,
-                                'default': True
-                            },
-                            {'locale_id': self.en_locale_id, 'content': en_text},
-                            {'locale_id': self.es_locale_id, 'content': es_text},
-                        ]
-                    )
+                    dc_item = self._create_dc_for_item(safe_dc_name, item)
 
                     if dc_item:
                         placeholder = dc_item.get('placeholder', '')
                         dc_id = dc_item.get('id')
-
-                        dc_info = {
-                            'id': dc_id,
-                            'name': safe_dc_name,
-                            'placeholder': placeholder,
-                            'variants': {}
-                        }
-                        self.dc_map[placeholder] = dc_info
-                        self.dc_by_name[safe_dc_name.lower()] = dc_info
-                        self.dc_name_map[safe_dc_name.lower()] = placeholder
-
                         log_signal.emit(f"    Created DC: {placeholder}")
 
                 except Exception as e:
                     error_str = str(e)
 
                     if '422' in error_str:
-                        self._refresh_dc_cache()
+                        self._refresh_dc_cache(since=create_started)
                         existing_dc = self._find_dc_by_name(safe_dc_name)
 
                         if existing_dc:
@@ -1793,112 +2228,30 @@ class ZendeskController:
     ):
         """Update a Zendesk object to use a DC placeholder."""
         try:
-            if obj_type == 'ticket_field':
-                self.api.update_ticket_field(obj_id, {field_name: placeholder})
-
-            elif obj_type == 'ticket_field_option':
-                if not parent_id:
-                    raise Exception("No parent_id for ticket_field_option")
-                if not option_value:
-                    raise Exception("No option_value for ticket_field_option")
-                if self._deferred_option_updates is not None:
-                    key = ('ticket_field', parent_id)
-                    entry = self._deferred_option_updates.setdefault(
-                        key, {'updates': {}, 'items': []}
-                    )
-                    entry['updates'][option_value] = placeholder
-                    if item is not None:
-                        entry['items'].append(item)
-                    log_signal.emit(f"    Queued for batch update (field {parent_id})")
-                else:
-                    log_signal.emit(f"    Updating via field, value='{option_value}'")
-                    self.api.update_ticket_field_option_via_field(
-                        parent_id, option_value, placeholder
-                    )
-
-            elif obj_type == 'ticket_form':
-                self.api.update_ticket_form(obj_id, {field_name: placeholder})
-
-            elif obj_type == 'custom_status':
-                self.api.update_custom_status(
-                    obj_id, {field_name: placeholder}
-                )
+            updater = self._OBJECT_UPDATERS.get(obj_type)
+            if updater is not None:
+                getattr(self.api, updater)(obj_id, {field_name: placeholder})
+                return
 
-            elif obj_type == 'user_field':
-                self.api.update_user_field(obj_id, {field_name: placeholder})
-
-            elif obj_type == 'user_field_option':
-                if not parent_id:
-                    raise Exception("No parent_id for user_field_option")
-                if not option_value:
-                    raise Exception("No option_value for user_field_option")
-                if self._deferred_option_updates is not None:
-                    key = ('user_field', parent_id)
-                    entry = self._deferred_option_updates.setdefault(
-                        key, {'updates': {}, 'items': []}
-                    )
-                    entry['updates'][option_value] = placeholder
-                    if item is not None:
-                        entry['items'].append(item)
-                    log_signal.emit(f"    Queued for batch update (field {parent_id})")
-                else:
-                    self.api.update_user_field_option_via_field(
-                        parent_id, option_value, placeholder
-                    )
+            option_updater = self._OPTION_UPDATERS.get(obj_type)
+            if option_updater is None:
+                raise Exception(f"Unsupported object type: {obj_type}")
 
-            elif obj_type == 'organization_field':
-                self.api.update_organization_field(
-                    obj_id, {field_name: placeholder}
+            field_type, via_field = option_updater
+            if not parent_id:
+                raise Exception(f"No parent_id for {obj_type}")
+            if not option_value:
+                raise Exception(f"No option_value for {obj_type}")
+            if self._deferred_option_updates is not None:
+                self._queue_option_update(
+                    field_type, parent_id, option_value, placeholder, item
                 )
-
-            elif obj_type == 'organization_field_option':
-                if not parent_id:
-                    raise Exception("No parent_id for organization_field_option")
-                if not option_value:
-                    raise Exception("No option_value for organization_field_option")
-                if self._deferred_option_updates is not None:
-                    key = ('organization_field', parent_id)
-                    entry = self._deferred_option_updates.setdefault(
-                        key, {'updates': {}, 'items': []}
-                    )
-                    entry['updates'][option_value] = placeholder
-                    if item is not None:
-                        entry['items'].append(item)
-                    log_signal.emit(f"    Queued for batch update (field {parent_id})")
-                else:
-                    self.api.update_organization_field_option_via_field(
-                        parent_id, option_value, placeholder
-                    )
-
-            elif obj_type == 'group':
-                self.api.update_group(obj_id, {field_name: placeholder})
-
-            elif obj_type == 'macro':
-                self.api.update_macro(obj_id, {field_name: placeholder})
-
-            elif obj_type == 'trigger':
-                self.api.update_trigger(obj_id, {field_name: placeholder})
-
-            elif obj_type == 'automation':
-                self.api.update_automation(obj_id, {field_name: placeholder})
-
-            elif obj_type == 'view':
-                self.api.update_view(obj_id, {field_name: placeholder})
-
-            elif obj_type == 'sla_policy':
-                self.api.update_sla_policy(obj_id, {field_name: placeholder})
-
-            elif obj_type == 'category':
-                self.api.update_hc_category(obj_id, {field_name: placeholder})
-
-            elif obj_type == 'section':
-                self.api.update_hc_section(obj_id, {field_name: placeholder})
-
-            elif obj_type == 'article':
-                self.api.update_hc_article(obj_id, {field_name: placeholder})
-
+                log_signal.emit(f"    Queued for batch update (field {parent_id})")
             else:
-                raise Exception(f"Unsupported object type: {obj_type}")
+                log_signal.emit(f"    Updating via field, value='{option_value}'")
+                getattr(self.api, via_field)(
+                    parent_id, option_value, placeholder
+                )
 
         except Exception as e:
             log_signal.emit(f"    Warning: Could not update {obj_type}: {e}")
@@ -1920,8 +2273,7 @@ class ZendeskController:
         }
 
         try:
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(backup_data, f, ensure_ascii=False, indent=2)
+            _write_json(filepath, backup_data)
             log_signal.emit(f"Backup created: {filepath}")
             return filepath
         except Exception as e:
@@ -1938,8 +2290,7 @@ class ZendeskController:
         log_signal.emit(f"Loading backup: {filepath}")
 
         try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            data = _read_json(filepath)
 
             items = data.get('items', [])
             log_signal.emit(f"Loaded {len(items)} items from backup")
@@ -1955,45 +2306,78 @@ class ZendeskController:
         progress_signal,
         log_signal
     ) -> str:
-        """Restore items from backup data."""
+        """Restore items from backup data.
+
+        Items are independent, so they are restored on a bounded thread
+        pool. Field options are queued and written back with one GET+PUT
+        per parent field, which also keeps concurrent restores of sibling
+        options from overwriting each other.
+        """
         self._reset_stop()
 
         total = len(items)
-        success_count = 0
-        failed_count = 0
+        result = {'success': [], 'failed': []}
 
         log_signal.emit(f"Restoring {total} items...")
 
-        for i, item in enumerate(items):
-            if self._should_stop():
-                log_signal.emit("Restore canceled by user")
-                raise Exception("Canceled by user")
+        progress = _ProgressThrottle(
+            progress_signal, total, "Restoring {done}/{total}..."
+        )
+        self._deferred_option_updates = {}
+        executor = ThreadPoolExecutor(max_workers=API_CONFIG.THREAD_POOL_SIZE)
+        try:
+            futures = {
+                executor.submit(self._restore_one, item, log_signal): item
+                for item in items
+            }
+            done = 0
+            for future in as_completed(futures):
+                item = futures[future]
+                done += 1
+                progress.update(done)
+
+                if future.result():
+                    result['success'].append(item)
+                else:
+                    result['failed'].append(item)
 
-            progress_signal.emit(i + 1, total, f"Restoring {i + 1}/{total}...")
+                if self._should_stop():
+                    log_signal.emit("Restore canceled by user")
+                    raise Canceled()
 
-            try:
-                obj_type = item.get('type')
-                obj_id = item.get('obj_id')
-                field_name = item.get('field_name')
-                original_value = item.get('current_value', '')
-                option_value = item.get('option_value', '')
-
-                log_signal.emit(f"  Restoring {obj_type} {obj_id}...")
-
-                self._update_object_with_dc(
-                    obj_type, obj_id, field_name,
-                    original_value, item.get('parent_id'),
-                    option_value, log_signal
-                )
+            self._flush_deferred_option_updates(log_signal, result)
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+            self._deferred_option_updates = None
 
-                success_count += 1
+        return (
+            f"Restored {len(result['success'])} items, "
+            f"{len(result['failed'])} failed"
+        )
 
-            except Exception as e:
-                logger.error(f"Failed to restore item: {e}")
-                log_signal.emit(f"    Error: {e}")
-                failed_count += 1
+    def _restore_one(self, item: Dict[str, Any], log_signal) -> bool:
+        """Write one backed-up item's original value back to Zendesk."""
+        try:
+            obj_type = item.get('type')
+            obj_id = item.get('obj_id')
+            field_name = item.get('field_name')
+            original_value = item.get('current_value', '')
+            option_value = item.get('option_value', '')
+
+            logger.debug(f"Restoring {obj_type} {obj_id}...")
+
+            self._update_object_with_dc(
+                obj_type, obj_id, field_name,
+                original_value, item.get('parent_id'),
+                option_value, log_signal,
+                item=item,
+            )
+            return True
 
-        return f"Restored {success_count} items, {failed_count} failed"
+        except Exception as e:
+            logger.error(f"Failed to restore item: {e}")
+            log_signal.emit(f"    Error: {e}")
+            return False
 
     def clear_cache(self) -> bool:
         """Clear translation cache."""
@@ -2026,8 +2410,7 @@ class ZendeskController:
                 'cache_expiry_days': cache_expiry_days
             }
 
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
+            _write_json(filepath, data)
 
             return True
 
@@ -2041,8 +2424,7 @@ class ZendeskController:
             if not os.path.exists(filepath):
                 return None
 
-            with open(filepath, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            return _read_json(filepath)
 
         except Exception as e:
             logger.error(f"Error loading profile: {e}")
@@ -9,6 +9,7 @@ This module uses:
 - AcronymProtector from utils.py for acronym protection
 """
 
+import re
 import time
 import random
 import threading
@@ -26,6 +27,14 @@ from zendesk_dc_manager.utils import AcronymProtector
 from zendesk_dc_manager.types import TranslationStats
 
 
+# Text that is a URL or e-mail address somewhere (matches 'http://',
+# 'https://', '://', 'www.' and '@') is left untranslated.
+_URL_OR_EMAIL_RE = re.compile(r'://|www\.|@', re.IGNORECASE)
+# Bare numbers such as "1,234.5" or "10-20": what is left once , . - are
+# deleted is all digits (str.isdigit, so '²' etc. count as digits too).
+_NUMERIC_PUNCT = str.maketrans('', '', ',.-')
+
+
 class TranslationService:
     """Translation service. Provider priority: DeepL > Google Cloud > Google Web."""
 
@@ -70,6 +79,11 @@ class TranslationService:
 
         self.cache = PersistentCache(db_path=cache_file)
 
+        # New translations waiting to be written to the cache in one
+        # transaction, keyed by (text, target_lang)
+        self._pending_cache: Dict[Tuple[str, str], str] = {}
+        self._pending_lock = threading.Lock()
+
         # Rate limiting
         self._last_request_time = 0.0
         self._request_lock = threading.Lock()
@@ -115,7 +129,12 @@ class TranslationService:
 
         text = text.strip()
 
-        # Check cache first
+        # Check cache first, including translations not yet flushed
+        with self._pending_lock:
+            pending = self._pending_cache.get((text, target_lang))
+        if pending is not None:
+            return pending, True, False
+
         cache_result = self.cache.get_with_age(text, target_lang)
         if cache_result:
             cached_text, age_days = cache_result
@@ -166,7 +185,7 @@ class TranslationService:
                     )
                     needs_attention = placeholder_lost or acronym_missing
 
-                self.cache.set(text, target_lang, translated)
+                self._queue_cache_write(text, target_lang, translated)
                 return translated, False, needs_attention
 
             return None, False, False
@@ -175,35 +194,45 @@ class TranslationService:
             logger.error(f"Translation error: {e}")
             return None, False, False
 
+    def _queue_cache_write(self, text: str, target_lang: str, translated: str):
+        """Buffer a cache write, flushing once a full batch is queued."""
+        with self._pending_lock:
+            self._pending_cache[(text, target_lang)] = translated
+            full = len(self._pending_cache) >= TRANSLATION_CONFIG.CACHE_WRITE_BATCH_SIZE
+        if full:
+            self.flush_cache()
+
+    def flush_cache(self) -> int:
+        """Write all buffered translations to the cache in one transaction."""
+        with self._pending_lock:
+            if not self._pending_cache:
+                return 0
+            rows = [
+                (text, lang, translated)
+                for (text, lang), translated in self._pending_cache.items()
+            ]
+            self._pending_cache = {}
+        return self.cache.set_many(rows)
+
     def _needs_translation(self, text: str) -> bool:
         """Check if text actually needs translation."""
-        # Empty or whitespace only
-        if not text or not text.strip():
-            return False
+        text = text.strip() if text else ''
 
-        # Single character
-        if len(text.strip()) <= 1:
+        # Empty, whitespace only or a single character
+        if len(text) <= 1:
             return False
 
         # Numbers only
-        clean_text = text.strip().replace(',', '').replace('.', '').replace('-', '')
-        if clean_text.isdigit():
+        if text.translate(_NUMERIC_PUNCT).isdigit():
             return False
 
         # URL or email
-        url_patterns = ['http://', 'https://', 'www.', '@', '://']
-        if any(p in text.lower() for p in url_patterns):
+        if _URL_OR_EMAIL_RE.search(text):
             return False
 
-        # Placeholder patterns
-        placeholder_patterns = [
-            '{{', '}}', '${', '%s', '%d', '{0}', '{1}',
-            '<%', '%>', '[[', ']]'
-        ]
-        if any(p in text for p in placeholder_patterns):
-            # Only skip if entire text is a placeholder
-            if text.startswith('{{') and text.endswith('}}'):
-                return False
+        # Entire text is a placeholder
+        if text.startswith('{{') and text.endswith('}}'):
+            return False
 
         return True
 
@@ -334,10 +363,13 @@ class TranslationService:
 
     def clear_cache(self) -> bool:
         """Clear the translation cache."""
+        with self._pending_lock:
+            self._pending_cache = {}
         return self.cache.clear()
 
     def get_cache_stats(self) -> Dict[str, int]:
         """Get cache statistics."""
+        self.flush_cache()
         stats = self.cache.get_stats()
         return {
             'total_entries': stats.get('entries', 0),
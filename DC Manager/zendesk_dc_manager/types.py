@@ -2,6 +2,7 @@
 Type definitions and data structures for Zendesk DC Manager.
 """
 
+import sys
 import threading
 from dataclasses import dataclass
 from enum import Enum, auto
@@ -41,7 +42,6 @@ try:
         parent_name: str
         status_category: str
         is_default: bool
-        force_update: bool
 
 except ImportError:
     # Python < 3.8 fallback — treat as plain dict alias
@@ -49,8 +49,18 @@ except ImportError:
 
 from zendesk_dc_manager.config import logger
 
+# dataclass(slots=True) needs Python 3.10+; older interpreters keep __dict__.
+_SLOTS: Dict[str, bool] = {'slots': True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+class Canceled(Exception):
+    """Raised when the user cancels a running operation."""
+
+    def __init__(self, message: str = "Canceled by user"):
+        super().__init__(message)
+
+
+@dataclass(**_SLOTS)
 class TranslationStats:
     """Statistics from a translation run."""
 
@@ -95,17 +105,19 @@ class AppState(Enum):
 
     @property
     def display_name(self) -> str:
-        names = {
-            AppState.IDLE: "Ready",
-            AppState.CONNECTING: "Connecting...",
-            AppState.SCANNING: "Scanning...",
-            AppState.TRANSLATING: "Translating...",
-            AppState.APPLYING: "Applying Changes...",
-            AppState.ROLLING_BACK: "Rolling Back...",
-            AppState.LOADING_BACKUP: "Loading Backup...",
-            AppState.CLEARING_CACHE: "Clearing Cache...",
-        }
-        return names.get(self, self.name)
+        return _APPSTATE_DISPLAY_NAMES.get(self, self.name)
+
+
+_APPSTATE_DISPLAY_NAMES: Dict[AppState, str] = {
+    AppState.IDLE: "Ready",
+    AppState.CONNECTING: "Connecting...",
+    AppState.SCANNING: "Scanning...",
+    AppState.TRANSLATING: "Translating...",
+    AppState.APPLYING: "Applying Changes...",
+    AppState.ROLLING_BACK: "Rolling Back...",
+    AppState.LOADING_BACKUP: "Loading Backup...",
+    AppState.CLEARING_CACHE: "Clearing Cache...",
+}
 
 
 class StateManager:
@@ -116,33 +128,44 @@ class StateManager:
         ui_callback: Optional[Callable[[AppState], None]] = None
     ):
         self._state = AppState.IDLE
-        self._lock = threading.RLock()
+        # Non-reentrant: no method takes the lock while already holding it.
+        self._lock = threading.Lock()
         self._ui_callback = ui_callback
 
+    # Reads are lock-free: _state is only ever rebound to another AppState
+    # member, and a single attribute load is atomic under the GIL, so a
+    # reader sees either the old or the new state. Only the writers take the
+    # lock: the check-and-set in try_transition and the read-then-reset in
+    # force_reset, so the two never interleave.
     @property
     def state(self) -> AppState:
-        with self._lock:
-            return self._state
+        return self._state
 
     @property
     def is_busy(self) -> bool:
-        return self.state != AppState.IDLE
+        return self._state is not AppState.IDLE
 
     @property
     def is_idle(self) -> bool:
-        return self.state == AppState.IDLE
+        return self._state is AppState.IDLE
 
     def _notify_ui(self, state: AppState):
-        if self._ui_callback:
-            try:
-                self._ui_callback(state)
-            except Exception as e:
-                logger.warning(f"UI callback error: {e}")
+        callback = self._ui_callback
+        if callback is None:
+            return
+        try:
+            callback(state)
+        except Exception as e:
+            logger.warning(f"UI callback error: {e}")
 
     def force_reset(self):
         with self._lock:
+            changed = self._state is not AppState.IDLE
             self._state = AppState.IDLE
-        self._notify_ui(AppState.IDLE)
+        # Every operation's finish handler resets; skip the redundant
+        # notification when the state was already IDLE.
+        if changed:
+            self._notify_ui(AppState.IDLE)
 
     def try_transition(self, new_state: AppState) -> bool:
         with self._lock:
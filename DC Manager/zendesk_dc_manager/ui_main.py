@@ -3,13 +3,14 @@ Main UI module for Zendesk DC Manager.
 """
 
 import threading
+from collections import Counter, defaultdict
 from typing import Optional, List, Dict, Any
 
-from PyQt6.QtCore import Qt, QTimer
+from PyQt6.QtCore import Qt, QSignalBlocker, QThreadPool, QTimer
 from PyQt6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QStackedWidget, QLabel, QPushButton, QLineEdit,
-    QTextEdit, QGroupBox, QCheckBox, QComboBox,
+    QPlainTextEdit, QGroupBox, QCheckBox, QComboBox,
     QSpinBox, QFileDialog, QMessageBox, QSplitter,
     QGridLayout, QApplication, QFrame,
 )
@@ -30,7 +31,9 @@ from zendesk_dc_manager.config import (
     PLACEHOLDER_COLORS,
     PLACEHOLDER_TEXT_COLORS,
 )
-from zendesk_dc_manager.types import AppState, StateManager, TranslationStats
+from zendesk_dc_manager.types import (
+    AppState, Canceled, StateManager, TranslationStats,
+)
 from zendesk_dc_manager.utils import validate_subdomain, validate_email, validate_token
 from zendesk_dc_manager.controller import ZendeskController
 from zendesk_dc_manager.ui_widgets import (
@@ -42,6 +45,127 @@ from zendesk_dc_manager.ui_widgets import (
 )
 
 
+# Applied once on the sidebar; the descendant selectors style every nav
+# button, so Qt parses the rules once instead of once per button.
+_SIDEBAR_STYLESHEET = """
+    QWidget#sidebar {
+        background-color: #1F2937;
+    }
+    QWidget#sidebar QPushButton {
+        background-color: transparent;
+        color: #D1D5DB;
+        border: none;
+        border-radius: 6px;
+        padding: 12px 16px;
+        text-align: left;
+        font-size: 13px;
+        font-weight: 500;
+    }
+    QWidget#sidebar QPushButton:hover {
+        background-color: #374151;
+        color: #F9FAFB;
+    }
+    QWidget#sidebar QPushButton:checked {
+        background-color: #3B82F6;
+        color: #FFFFFF;
+    }
+    QWidget#sidebar QPushButton:disabled {
+        color: #6B7280;
+    }
+"""
+
+_LEGEND_QSS_TEMPLATE = (
+    "QLabel {{ background-color: {bg}; color: {fg}; padding: 2px 5px; "
+    "border-radius: 3px; font-weight: 500; font-size: 9px; }}"
+)
+
+# Preview-page label sheets, formatted once at import rather than per
+# label each time the page is built.
+_LEGEND_QSS = {
+    src: _LEGEND_QSS_TEMPLATE.format(bg=SOURCE_COLORS[src], fg=TEXT_COLORS[src])
+    for src in SOURCE_COLORS
+}
+_PLACEHOLDER_LEGEND_QSS = {
+    src: _LEGEND_QSS_TEMPLATE.format(
+        bg=PLACEHOLDER_COLORS[src], fg=PLACEHOLDER_TEXT_COLORS[src]
+    )
+    for src in PLACEHOLDER_COLORS
+}
+
+# Preview summary row, rendered as one rich-text label so a stats tick is
+# a single setText and repaint. Keys match the table's stats dict, plus
+# 'showing' from the filter pass.
+_SUMMARY_GAP = "&nbsp;&nbsp;&nbsp;"
+_SUMMARY_HTML = _SUMMARY_GAP.join([
+    '<span style="font-weight: 600;">Showing: {showing} / {total}</span>',
+    '<span style="color: #3B82F6; font-weight: 600;">'
+    'Selected: {selected_count}</span>',
+    '<span style="color: #D1D5DB;">|</span>',
+] + [
+    f'<span style="color: {TEXT_COLORS[src]};">{label}: {{{key}}}</span>'
+    for src, label, key in (
+        (SOURCE_ZENDESK_DC, "From DC", 'items_from_dc'),
+        (SOURCE_TRANSLATED, "Translated", 'items_translated'),
+        (SOURCE_NEW, "Pending", 'items_pending'),
+        (SOURCE_FAILED, "Failed", 'items_failed'),
+        (SOURCE_ATTENTION, "Attention", 'items_attention'),
+        (SOURCE_RESERVED, "System", 'items_reserved'),
+    )
+])
+_SUMMARY_STATS_KEYS = (
+    'total', 'selected_count', 'items_from_dc', 'items_translated',
+    'items_pending', 'items_failed', 'items_attention', 'items_reserved',
+)
+
+_WT_STYLE_IDLE = (
+    "background-color: #F3F4F6; color: #6B7280; "
+    "padding: 4px 10px; border-radius: 4px; font-size: 11px;"
+)
+_WT_STYLE_FORCE = (
+    "background-color: #FEF3C7; color: #92400E; "
+    "padding: 4px 10px; border-radius: 4px; font-size: 11px; "
+    "font-weight: 500;"
+)
+_WT_STYLE_PENDING = (
+    "background-color: #EFF6FF; color: #1E40AF; "
+    "padding: 4px 10px; border-radius: 4px; font-size: 11px;"
+)
+_WT_STYLE_DONE = (
+    "background-color: #DCFCE7; color: #166534; "
+    "padding: 4px 10px; border-radius: 4px; font-size: 11px;"
+)
+
+# Log block rules.
+_SEP = "=" * 50
+_SUBSEP = "-" * 50
+
+# Scan results block, rendered with one format_map pass; keys missing from
+# the scan stats (types not selected) show as 0.
+_SCAN_TEMPLATE = "\n".join([
+    _SEP,
+    "SCAN RESULTS",
+    _SEP,
+    "Ticket Fields: {valid_fields}",
+    "Ticket Forms: {valid_forms}",
+    "Custom Statuses: {valid_custom_statuses}",
+    "User Fields: {valid_user_fields}",
+    "Organization Fields: {valid_org_fields}",
+    "Groups: {valid_groups}",
+    "Macros: {valid_macros}",
+    "Triggers: {valid_triggers}",
+    "Automations: {valid_automations}",
+    "Views: {valid_views}",
+    "SLA Policies: {valid_sla_policies}",
+    "HC Categories: {valid_cats}",
+    "HC Sections: {valid_sects}",
+    "HC Articles: {valid_arts}",
+    _SUBSEP,
+    "TOTAL ITEMS: {total_items}",
+    "System Fields: {system_excluded}",
+    _SEP,
+])
+
+
 class SidebarWidget(QWidget):
     """Sidebar navigation widget."""
 
@@ -49,11 +173,7 @@ class SidebarWidget(QWidget):
         super().__init__(parent)
         self.setObjectName("sidebar")
         self.setFixedWidth(UI_CONFIG.SIDEBAR_WIDTH)
-        self.setStyleSheet("""
-            QWidget#sidebar {
-                background-color: #1F2937;
-            }
-        """)
+        self.setStyleSheet(_SIDEBAR_STYLESHEET)
 
         layout = QVBoxLayout(self)
         layout.setContentsMargins(8, 16, 8, 16)
@@ -80,29 +200,6 @@ class SidebarWidget(QWidget):
             btn = QPushButton(f"  {icon}  {name}")
             btn.setCheckable(True)
             btn.setEnabled(name in ["Connect", "Config"])
-            btn.setStyleSheet("""
-                QPushButton {
-                    background-color: transparent;
-                    color: #D1D5DB;
-                    border: none;
-                    border-radius: 6px;
-                    padding: 12px 16px;
-                    text-align: left;
-                    font-size: 13px;
-                    font-weight: 500;
-                }
-                QPushButton:hover {
-                    background-color: #374151;
-                    color: #F9FAFB;
-                }
-                QPushButton:checked {
-                    background-color: #3B82F6;
-                    color: #FFFFFF;
-                }
-                QPushButton:disabled {
-                    color: #6B7280;
-                }
-            """)
             self.buttons.append(btn)
             layout.addWidget(btn)
 
@@ -234,14 +331,29 @@ class ZendeskWizard(QMainWindow):
         )
 
         self.controller = ZendeskController()
-        self.state_manager = StateManager(self._on_state_change)
+        self.state_manager = StateManager()
 
         self.worker: Optional[StepWorker] = None
         self._worker_lock = threading.Lock()
 
         self._pending_backup_items: List[Dict[str, Any]] = []
         self._work_items_cache: List[Dict[str, Any]] = []
+        self._work_items_version = -1
         self._cached_stats: Dict[str, int] = {}
+        self._summary_values: Dict[str, int] = dict.fromkeys(
+            ('showing',) + _SUMMARY_STATS_KEYS, 0
+        )
+
+        # Selection and stats signals can arrive in bursts (select all,
+        # shift-click); restart a short timer so the label is computed once.
+        self._will_translate_timer = QTimer(self)
+        self._will_translate_timer.setSingleShot(True)
+        self._will_translate_timer.setInterval(
+            UI_CONFIG.WILL_TRANSLATE_DEBOUNCE_MS
+        )
+        self._will_translate_timer.timeout.connect(
+            self._refresh_will_translate_label
+        )
         self._is_connected = False
         self._has_scan_data = False
 
@@ -307,15 +419,35 @@ class ZendeskWizard(QMainWindow):
 
         main_layout.addWidget(right_container, 1)
 
-        self._init_page_connect()
-        self._init_page_scan()
-        self._init_page_preview()
-        self._init_page_apply()
-        self._init_page_rollback()
-        self._init_page_config()
+        # Connect and Config are built up front (saved credentials fill in
+        # both); the other pages start as placeholders and are built by
+        # _ensure_page on first visit.
+        self._page_builders = {
+            0: self._init_page_connect,
+            1: self._init_page_scan,
+            2: self._init_page_preview,
+            3: self._init_page_apply,
+            4: self._init_page_rollback,
+            5: self._init_page_config,
+        }
+        for _ in self._page_builders:
+            self.stack.addWidget(QWidget())
+        self._ensure_page(0)
+        self._ensure_page(5)
 
+        self.stack.setCurrentIndex(0)
         self.sidebar.select(0)
 
+    def _ensure_page(self, index: int):
+        """Build the page at index if it is still a placeholder."""
+        builder = self._page_builders.pop(index, None)
+        if builder is None:
+            return
+        placeholder = self.stack.widget(index)
+        self.stack.insertWidget(index, builder())
+        self.stack.removeWidget(placeholder)
+        placeholder.deleteLater()
+
     def _init_page_connect(self):
         page = WizardPage(
             "Connect to Zendesk",
@@ -369,21 +501,7 @@ class ZendeskWizard(QMainWindow):
         self.btn_toggle_token.setMinimumWidth(70)
         self.btn_toggle_token.setCheckable(True)
         self.btn_toggle_token.clicked.connect(self._toggle_token_visibility)
-        self.btn_toggle_token.setStyleSheet("""
-            QPushButton {
-                background-color: #E5E7EB;
-                border: 1px solid #D1D5DB;
-                border-radius: 4px;
-                padding: 6px 12px;
-            }
-            QPushButton:checked {
-                background-color: #DBEAFE;
-                border-color: #3B82F6;
-            }
-            QPushButton:hover {
-                background-color: #D1D5DB;
-            }
-        """)
+        self.btn_toggle_token.setObjectName("toggleButton")
         token_row.addWidget(self.btn_toggle_token)
         form_layout.addLayout(token_row, 2, 1)
 
@@ -450,28 +568,12 @@ class ZendeskWizard(QMainWindow):
 
         self.btn_connect = QPushButton("Connect")
         self.btn_connect.setMinimumWidth(120)
-        self.btn_connect.setStyleSheet("""
-            QPushButton {
-                background-color: #3B82F6;
-                color: white;
-                border: none;
-                border-radius: 6px;
-                padding: 10px 24px;
-                font-weight: 600;
-                font-size: 14px;
-            }
-            QPushButton:hover {
-                background-color: #2563EB;
-            }
-            QPushButton:pressed {
-                background-color: #1D4ED8;
-            }
-        """)
+        self.btn_connect.setObjectName("connectButton")
         self.btn_connect.clicked.connect(self.run_connect)
         btn_row.addWidget(self.btn_connect)
         page.add_layout(btn_row)
 
-        self.stack.addWidget(page)
+        return page
 
     def _toggle_token_visibility(self, checked: bool):
         if checked:
@@ -588,6 +690,24 @@ class ZendeskWizard(QMainWindow):
             )
         )
 
+        # (scan config key, checkbox) pairs read by run_scan
+        self._scan_checkboxes = (
+            ('fields', self.chk_scan_fields),
+            ('forms', self.chk_scan_forms),
+            ('user_fields', self.chk_scan_user_fields),
+            ('org_fields', self.chk_scan_org_fields),
+            ('macros', self.chk_scan_macros),
+            ('triggers', self.chk_scan_triggers),
+            ('automations', self.chk_scan_automations),
+            ('views', self.chk_scan_views),
+            ('sla_policies', self.chk_scan_sla_policies),
+            ('custom_statuses', self.chk_scan_custom_statuses),
+            ('groups', self.chk_scan_groups),
+            ('cats', self.chk_scan_cats),
+            ('sects', self.chk_scan_sects),
+            ('arts', self.chk_scan_arts),
+        )
+
         # Arrange groups in a 2-column grid:
         #   Row 0: [Ticket Fields & Forms]  [Ticket Statuses]
         #   Row 1: [User & Organization]    [Help Center]
@@ -626,24 +746,12 @@ class ZendeskWizard(QMainWindow):
         btn_row.addStretch()
         self.btn_scan = QPushButton("Start Scan")
         self.btn_scan.setMinimumWidth(120)
-        self.btn_scan.setStyleSheet("""
-            QPushButton {
-                background-color: #3B82F6;
-                color: white;
-                border: none;
-                border-radius: 6px;
-                padding: 10px 24px;
-                font-weight: 600;
-            }
-            QPushButton:hover {
-                background-color: #2563EB;
-            }
-        """)
+        self.btn_scan.setObjectName("scanButton")
         self.btn_scan.clicked.connect(self.run_scan)
         btn_row.addWidget(self.btn_scan)
         page.add_layout(btn_row)
 
-        self.stack.addWidget(page)
+        return page
 
     def _init_page_preview(self):
         page = CompactWizardPage(
@@ -651,13 +759,21 @@ class ZendeskWizard(QMainWindow):
             "Review scanned items and run translations"
         )
 
+        # Checkbox toggles restart a short timer, so a burst of state
+        # changes (programmatic or quick clicks) runs the table filter once.
+        self._filter_debounce = QTimer(self)
+        self._filter_debounce.setSingleShot(True)
+        self._filter_debounce.setInterval(UI_CONFIG.FILTER_DEBOUNCE_MS)
+        self._filter_debounce.timeout.connect(self.apply_table_filter)
+
         # Filter rows matching the scan tab categories
         def _make_filter_chk(label, tooltip=None):
             chk = QCheckBox(label)
             chk.setChecked(True)
             if tooltip:
                 chk.setToolTip(tooltip)
-            chk.stateChanged.connect(self.apply_table_filter)
+            # Lambda drops the state arg, which start() would take as msec
+            chk.stateChanged.connect(lambda _: self._filter_debounce.start())
             return chk
 
         self.chk_filter_fields = _make_filter_chk("Ticket Fields")
@@ -755,9 +871,9 @@ class ZendeskWizard(QMainWindow):
                 border-color: #3B82F6;
             }
         """)
-        self._search_debounce = QTimer()
+        self._search_debounce = QTimer(self)
         self._search_debounce.setSingleShot(True)
-        self._search_debounce.setInterval(200)
+        self._search_debounce.setInterval(UI_CONFIG.SEARCH_DEBOUNCE_MS)
         self._search_debounce.timeout.connect(self.apply_table_filter)
         self.txt_search_filter.textChanged.connect(
             lambda: self._search_debounce.start()
@@ -775,7 +891,6 @@ class ZendeskWizard(QMainWindow):
         # Table
         self.preview_table = PreviewTableWidget()
         self.preview_table.stats_updated.connect(self._on_table_stats_updated)
-        self.preview_table.cell_edited.connect(self._on_cell_edited)
         self.preview_table.selection_changed.connect(self._on_selection_changed)
         self.preview_table.loading_finished.connect(
             self._on_table_loading_finished
@@ -794,62 +909,17 @@ class ZendeskWizard(QMainWindow):
         summary_row = QHBoxLayout()
         summary_row.setSpacing(12)
 
-        self.lbl_sum_showing = QLabel("Showing: 0 / 0")
-        self.lbl_sum_showing.setStyleSheet("font-weight: 600; font-size: 11px;")
-        summary_row.addWidget(self.lbl_sum_showing)
-
-        self.lbl_sum_selected = QLabel("Selected: 0")
-        self.lbl_sum_selected.setStyleSheet(
-            "color: #3B82F6; font-weight: 600; font-size: 11px;"
-        )
-        summary_row.addWidget(self.lbl_sum_selected)
-
-        summary_row.addWidget(self._create_separator_label())
-
-        self.lbl_sum_from_dc = QLabel("From DC: 0")
-        self.lbl_sum_from_dc.setStyleSheet(
-            f"color: {TEXT_COLORS[SOURCE_ZENDESK_DC]}; font-size: 11px;"
-        )
-        summary_row.addWidget(self.lbl_sum_from_dc)
-
-        self.lbl_sum_translated = QLabel("Translated: 0")
-        self.lbl_sum_translated.setStyleSheet(
-            f"color: {TEXT_COLORS[SOURCE_TRANSLATED]}; font-size: 11px;"
-        )
-        summary_row.addWidget(self.lbl_sum_translated)
-
-        self.lbl_sum_pending = QLabel("Pending: 0")
-        self.lbl_sum_pending.setStyleSheet(
-            f"color: {TEXT_COLORS[SOURCE_NEW]}; font-size: 11px;"
-        )
-        summary_row.addWidget(self.lbl_sum_pending)
-
-        self.lbl_sum_failed = QLabel("Failed: 0")
-        self.lbl_sum_failed.setStyleSheet(
-            f"color: {TEXT_COLORS[SOURCE_FAILED]}; font-size: 11px;"
-        )
-        summary_row.addWidget(self.lbl_sum_failed)
-
-        self.lbl_sum_attention = QLabel("Attention: 0")
-        self.lbl_sum_attention.setStyleSheet(
-            f"color: {TEXT_COLORS[SOURCE_ATTENTION]}; font-size: 11px;"
-        )
-        summary_row.addWidget(self.lbl_sum_attention)
-
-        self.lbl_sum_reserved = QLabel("System: 0")
-        self.lbl_sum_reserved.setStyleSheet(
-            f"color: {TEXT_COLORS[SOURCE_RESERVED]}; font-size: 11px;"
-        )
-        summary_row.addWidget(self.lbl_sum_reserved)
+        self.lbl_summary = QLabel(_SUMMARY_HTML.format(**self._summary_values))
+        self.lbl_summary.setTextFormat(Qt.TextFormat.RichText)
+        self.lbl_summary.setStyleSheet("font-size: 11px;")
+        summary_row.addWidget(self.lbl_summary)
 
         summary_row.addStretch()
 
         # Translation info label on the right side of summary row
         self.lbl_will_translate = QLabel("ℹ️ Select items to translate")
-        self.lbl_will_translate.setStyleSheet(
-            "background-color: #F3F4F6; color: #6B7280; "
-            "padding: 4px 10px; border-radius: 4px; font-size: 11px;"
-        )
+        self.lbl_will_translate.setStyleSheet(_WT_STYLE_IDLE)
+        self._will_translate_style = _WT_STYLE_IDLE
         summary_row.addWidget(self.lbl_will_translate)
 
         bottom_layout.addLayout(summary_row)
@@ -871,21 +941,9 @@ class ZendeskWizard(QMainWindow):
         ]
 
         for source, label_text, tooltip in translation_legend_items:
-            bg = SOURCE_COLORS.get(source, SOURCE_COLORS[SOURCE_NEW])
-            fg = TEXT_COLORS.get(source, TEXT_COLORS[SOURCE_NEW])
-
             item_label = QLabel(label_text)
             item_label.setToolTip(tooltip)
-            item_label.setStyleSheet(f"""
-                QLabel {{
-                    background-color: {bg};
-                    color: {fg};
-                    padding: 2px 5px;
-                    border-radius: 3px;
-                    font-weight: 500;
-                    font-size: 9px;
-                }}
-            """)
+            item_label.setStyleSheet(_LEGEND_QSS[source])
             legend_button_row.addWidget(item_label)
 
         # Separator
@@ -900,23 +958,9 @@ class ZendeskWizard(QMainWindow):
         ]
 
         for source, label_text, tooltip in placeholder_legend_items:
-            bg = PLACEHOLDER_COLORS.get(source, PLACEHOLDER_COLORS['proposed'])
-            fg = PLACEHOLDER_TEXT_COLORS.get(
-                source, PLACEHOLDER_TEXT_COLORS['proposed']
-            )
-
             item_label = QLabel(label_text)
             item_label.setToolTip(tooltip)
-            item_label.setStyleSheet(f"""
-                QLabel {{
-                    background-color: {bg};
-                    color: {fg};
-                    padding: 2px 5px;
-                    border-radius: 3px;
-                    font-weight: 500;
-                    font-size: 9px;
-                }}
-            """)
+            item_label.setStyleSheet(_PLACEHOLDER_LEGEND_QSS[source])
             legend_button_row.addWidget(item_label)
 
         legend_button_row.addStretch()
@@ -943,20 +987,7 @@ class ZendeskWizard(QMainWindow):
         # Translate button
         self.btn_translate = QPushButton("Translate Selected")
         self.btn_translate.setMinimumWidth(140)
-        self.btn_translate.setStyleSheet("""
-            QPushButton {
-                background-color: #059669;
-                color: white;
-                border: none;
-                border-radius: 5px;
-                padding: 6px 16px;
-                font-weight: 600;
-                font-size: 12px;
-            }
-            QPushButton:hover {
-                background-color: #047857;
-            }
-        """)
+        self.btn_translate.setObjectName("translateButton")
         self.btn_translate.clicked.connect(self.run_translation)
         legend_button_row.addWidget(self.btn_translate)
 
@@ -964,13 +995,7 @@ class ZendeskWizard(QMainWindow):
 
         page.add_widget(bottom_widget)
 
-        self.stack.addWidget(page)
-
-    def _create_separator_label(self) -> QLabel:
-        """Create a separator label for summary row."""
-        sep = QLabel("|")
-        sep.setStyleSheet("color: #D1D5DB; font-size: 11px;")
-        return sep
+        return page
 
     def _init_page_apply(self):
         page = WizardPage(
@@ -1035,24 +1060,12 @@ class ZendeskWizard(QMainWindow):
         btn_row.addStretch()
         self.btn_apply = QPushButton("Apply Selected Changes")
         self.btn_apply.setMinimumWidth(200)
-        self.btn_apply.setStyleSheet("""
-            QPushButton {
-                background-color: #DC2626;
-                color: white;
-                border: none;
-                border-radius: 6px;
-                padding: 10px 24px;
-                font-weight: 600;
-            }
-            QPushButton:hover {
-                background-color: #B91C1C;
-            }
-        """)
+        self.btn_apply.setObjectName("applyButton")
         self.btn_apply.clicked.connect(self.run_apply)
         btn_row.addWidget(self.btn_apply)
         page.add_layout(btn_row)
 
-        self.stack.addWidget(page)
+        return page
 
     def _init_page_rollback(self):
         page = WizardPage(
@@ -1079,7 +1092,7 @@ class ZendeskWizard(QMainWindow):
         info_group = QGroupBox("Backup Contents")
         info_layout = QVBoxLayout(info_group)
         info_layout.setContentsMargins(12, 8, 12, 12)
-        self.rollback_info = QTextEdit()
+        self.rollback_info = QPlainTextEdit()
         self.rollback_info.setReadOnly(True)
         self.rollback_info.setPlaceholderText(
             "Backup file contents will appear here after loading..."
@@ -1098,28 +1111,13 @@ class ZendeskWizard(QMainWindow):
         self.btn_rollback = QPushButton("Restore Backup")
         self.btn_rollback.setMinimumWidth(140)
         self.btn_rollback.setEnabled(False)
-        self.btn_rollback.setStyleSheet("""
-            QPushButton {
-                background-color: #DC2626;
-                color: white;
-                border: none;
-                border-radius: 6px;
-                padding: 10px 24px;
-                font-weight: 600;
-            }
-            QPushButton:hover {
-                background-color: #B91C1C;
-            }
-            QPushButton:disabled {
-                background-color: #9CA3AF;
-            }
-        """)
+        self.btn_rollback.setObjectName("rollbackButton")
         self.btn_rollback.clicked.connect(self.run_rollback)
         btn_row.addWidget(self.btn_rollback)
 
         page.add_layout(btn_row)
 
-        self.stack.addWidget(page)
+        return page
 
     def _init_page_config(self):
         page = WizardPage(
@@ -1154,21 +1152,7 @@ class ZendeskWizard(QMainWindow):
         self.btn_toggle_api_key.setMinimumWidth(70)
         self.btn_toggle_api_key.setCheckable(True)
         self.btn_toggle_api_key.clicked.connect(self._toggle_api_key_visibility)
-        self.btn_toggle_api_key.setStyleSheet("""
-            QPushButton {
-                background-color: #E5E7EB;
-                border: 1px solid #D1D5DB;
-                border-radius: 4px;
-                padding: 6px 12px;
-            }
-            QPushButton:checked {
-                background-color: #DBEAFE;
-                border-color: #3B82F6;
-            }
-            QPushButton:hover {
-                background-color: #D1D5DB;
-            }
-        """)
+        self.btn_toggle_api_key.setObjectName("toggleButton")
         api_key_row.addWidget(self.btn_toggle_api_key)
         trans_layout.addLayout(api_key_row, 1, 1)
 
@@ -1210,7 +1194,7 @@ class ZendeskWizard(QMainWindow):
 
         page.add_stretch()
 
-        self.stack.addWidget(page)
+        return page
 
     def _toggle_api_key_visibility(self, checked: bool):
         if checked:
@@ -1329,6 +1313,7 @@ class ZendeskWizard(QMainWindow):
                 QMessageBox.warning(self, "Error", "Failed to load profile.")
 
     def goto(self, index: int):
+        self._ensure_page(index)
         if index == 3:
             self._log_apply_summary()
             self._update_apply_summary()
@@ -1338,18 +1323,20 @@ class ZendeskWizard(QMainWindow):
     def log_msg(self, message: str):
         self.log_panel.append(message)
 
+    def log_block(self, lines: List[str]):
+        """Append several lines to the log in one console update."""
+        self.log_panel.append("\n".join(lines))
+
     def lock_ui(self, locked: bool):
         self.sidebar.setEnabled(not locked)
-        self.btn_connect.setEnabled(not locked)
-        self.btn_scan.setEnabled(not locked)
-        self.btn_translate.setEnabled(not locked)
-        self.btn_apply.setEnabled(not locked)
-        self.btn_rollback.setEnabled(not locked)
-        self.btn_load_backup.setEnabled(not locked)
-        self.btn_clear_cache.setEnabled(not locked)
-
-    def _on_state_change(self, state: AppState):
-        pass
+        # Pages that have not been visited yet have no buttons to lock.
+        for name in (
+            'btn_connect', 'btn_scan', 'btn_translate', 'btn_apply',
+            'btn_rollback', 'btn_load_backup', 'btn_clear_cache',
+        ):
+            btn = getattr(self, name, None)
+            if btn is not None:
+                btn.setEnabled(not locked)
 
     def _on_cancel_clicked(self):
         self.controller.stop()
@@ -1357,46 +1344,31 @@ class ZendeskWizard(QMainWindow):
 
     def _cleanup_worker(self):
         with self._worker_lock:
-            if self.worker is not None:
-                self.worker.cancel()
-                if self.worker.isRunning():
-                    self.worker.quit()
-                    self.worker.wait(UI_CONFIG.WORKER_STOP_TIMEOUT_MS)
-                self.worker = None
+            worker, self.worker = self.worker, None
+        if worker is not None:
+            # Wait for this worker only, and outside the lock.
+            worker.cancel()
+            worker.wait(UI_CONFIG.WORKER_STOP_TIMEOUT_MS)
 
     def _on_table_stats_updated(self, stats: dict):
-        """Handle table statistics update - FIXED to use items_pending."""
-        total = stats.get('total', 0)
-        from_dc = stats.get('items_from_dc', 0)
-        translated = stats.get('items_translated', 0)
-        failed = stats.get('items_failed', 0)
-        attention = stats.get('items_attention', 0)
-        reserved = stats.get('items_reserved', 0)
-        pending = stats.get('items_pending', 0)
-        selected = stats.get('selected_count', 0)
-
-        self.lbl_sum_from_dc.setText(f"From DC: {from_dc}")
-        self.lbl_sum_translated.setText(f"Translated: {translated}")
-        self.lbl_sum_failed.setText(f"Failed: {failed}")
-        self.lbl_sum_attention.setText(f"Attention: {attention}")
-        self.lbl_sum_reserved.setText(f"System: {reserved}")
-        self.lbl_sum_selected.setText(f"Selected: {selected}")
-        self.lbl_sum_pending.setText(f"Pending: {pending}")
-
+        """Handle table statistics update; redraw only if a counter moved."""
         self._cached_stats = stats
-        self._update_will_translate_label()
-
-    def _on_cell_edited(self, row: int, field: str, value: str, source: str):
-        if 0 <= row < len(self._work_items_cache):
-            self.controller.update_work_item(row, {
-                field: value,
-                f'{field}_source': source
-            })
-            self._work_items_cache[row][field] = value
-            self._work_items_cache[row][f'{field}_source'] = source
+        if self._set_summary(
+            **{key: stats.get(key, 0) for key in _SUMMARY_STATS_KEYS}
+        ):
+            self._update_will_translate_label()
+
+    def _set_summary(self, **values: int) -> bool:
+        """Update summary counters; returns False if nothing changed."""
+        current = self._summary_values
+        if all(current[key] == value for key, value in values.items()):
+            return False
+        current.update(values)
+        self.lbl_summary.setText(_SUMMARY_HTML.format(**current))
+        return True
 
     def _on_selection_changed(self, count: int):
-        self.lbl_sum_selected.setText(f"Selected: {count}")
+        self._set_summary(selected_count=count)
         self._update_will_translate_label()
         self._update_apply_summary()
 
@@ -1404,67 +1376,35 @@ class ZendeskWizard(QMainWindow):
         self.apply_table_filter()
 
     def _update_will_translate_label(self):
+        """Schedule a refresh of the 'will translate' information label."""
+        self._will_translate_timer.start()
+
+    def _refresh_will_translate_label(self):
         """Update the 'will translate' information label."""
         if not hasattr(self, 'preview_table') or not self.preview_table:
             return
 
-        selected_rows = self.preview_table.get_selected_rows()
-        selected_count = len(selected_rows)
-
-        if selected_count == 0:
-            self.lbl_will_translate.setText("ℹ️ Select items to translate")
-            self.lbl_will_translate.setStyleSheet(
-                "background-color: #F3F4F6; color: #6B7280; "
-                "padding: 4px 10px; border-radius: 4px; font-size: 11px;"
+        if self.preview_table.get_selected_count() == 0:
+            self._set_will_translate(
+                "ℹ️ Select items to translate", _WT_STYLE_IDLE
             )
             return
 
         force_retranslate = self.chk_force_translate.isChecked()
 
-        will_translate = 0
-        already_done = 0
-        system_skipped = 0
-
-        # Define which sources count as "translated"
-        translated_sources = frozenset({
-            SOURCE_TRANSLATED,
-            SOURCE_CACHE,
-            SOURCE_MANUAL,
-            SOURCE_ZENDESK_DC,
-        })
-
-        for row in selected_rows:
-            if row < len(self._work_items_cache):
-                item = self._work_items_cache[row]
-
-                if item.get('is_system', False):
-                    system_skipped += 1
-                    continue
-
-                en_source = item.get('en_source', SOURCE_NEW)
-                es_source = item.get('es_source', SOURCE_NEW)
-
-                is_translated = (
-                    en_source in translated_sources and
-                    es_source in translated_sources
-                )
-
-                if force_retranslate:
-                    will_translate += 1
-                elif not is_translated:
-                    will_translate += 1
-                else:
-                    already_done += 1
+        pending, already_done, system_skipped = (
+            self.preview_table.selected_translate_states()
+        )
+        if force_retranslate:
+            will_translate = pending + already_done
+        else:
+            will_translate = pending
 
         if force_retranslate:
             msg = f"🔄 RE-TRANSLATE: {will_translate}"
             if system_skipped > 0:
                 msg += f" (skip {system_skipped} sys)"
-            style = (
-                "background-color: #FEF3C7; color: #92400E; "
-                "padding: 4px 10px; border-radius: 4px; font-size: 11px; "
-                "font-weight: 500;"
-            )
+            style = _WT_STYLE_FORCE
         else:
             if will_translate > 0:
                 msg = f"📝 Translate: {will_translate}"
@@ -1472,21 +1412,22 @@ class ZendeskWizard(QMainWindow):
                     msg += f" (skip {already_done} done)"
                 if system_skipped > 0:
                     msg += f" ({system_skipped} sys)"
-                style = (
-                    "background-color: #EFF6FF; color: #1E40AF; "
-                    "padding: 4px 10px; border-radius: 4px; font-size: 11px;"
-                )
+                style = _WT_STYLE_PENDING
             else:
                 msg = f"✅ All {already_done} translated"
                 if system_skipped > 0:
                     msg += f" ({system_skipped} sys)"
-                style = (
-                    "background-color: #DCFCE7; color: #166534; "
-                    "padding: 4px 10px; border-radius: 4px; font-size: 11px;"
-                )
+                style = _WT_STYLE_DONE
 
-        self.lbl_will_translate.setText(msg)
-        self.lbl_will_translate.setStyleSheet(style)
+        self._set_will_translate(msg, style)
+
+    def _set_will_translate(self, text: str, style: str):
+        """Set the label text, re-applying the stylesheet only on change."""
+        self.lbl_will_translate.setText(text)
+        # The styles are module constants, so identity is enough here.
+        if style is not self._will_translate_style:
+            self.lbl_will_translate.setStyleSheet(style)
+            self._will_translate_style = style
 
     def _update_apply_summary(self):
         if not hasattr(self, 'lbl_apply_summary'):
@@ -1495,19 +1436,11 @@ class ZendeskWizard(QMainWindow):
             return
 
         selected_rows = self.preview_table.get_selected_rows()
-        items = [
-            self._work_items_cache[r]
-            for r in selected_rows
-            if r < len(self._work_items_cache)
-        ]
-        non_system = [i for i in items if not i.get('is_system', False)]
-
-        if not non_system:
-            self.lbl_apply_summary.setText("No items selected.")
-            return
-
         force_update = self.chk_update_existing_dc.isChecked()
+        cache = self._work_items_cache
+        is_row_complete = self.preview_table.is_row_complete
 
+        total = 0
         create_count = 0
         link_count = 0
         update_count = 0
@@ -1515,7 +1448,15 @@ class ZendeskWizard(QMainWindow):
         attention_count = 0
         no_translation = 0
 
-        for item in non_system:
+        for row in selected_rows:
+            try:
+                item = cache[row]
+            except IndexError:
+                continue
+            if item.get('is_system', False):
+                continue
+            total += 1
+
             action = item.get('action', 'CREATE')
             already_linked = item.get('already_linked', False)
             en_source = item.get('en_source', SOURCE_NEW)
@@ -1524,7 +1465,7 @@ class ZendeskWizard(QMainWindow):
             if en_source == SOURCE_ATTENTION or es_source == SOURCE_ATTENTION:
                 attention_count += 1
 
-            if not item.get('en') or not item.get('es'):
+            if not is_row_complete(row):
                 no_translation += 1
 
             if already_linked and not force_update:
@@ -1537,8 +1478,11 @@ class ZendeskWizard(QMainWindow):
                 else:
                     link_count += 1
 
+        if not total:
+            self.lbl_apply_summary.setText("No items selected.")
+            return
+
         lines = []
-        total = len(non_system)
         lines.append(f"<b>{total} item(s) selected</b>")
         if create_count:
             lines.append(f"  • Create new DC: <b>{create_count}</b>")
@@ -1585,7 +1529,7 @@ class ZendeskWizard(QMainWindow):
             )
 
         self._cleanup_worker()
-        self.status_bar.show_progress(0, 0, "Connecting...", "")
+        self.status_bar.set_phase("Connecting...")
         self.lock_ui(True)
 
         with self._worker_lock:
@@ -1594,14 +1538,10 @@ class ZendeskWizard(QMainWindow):
                     subdomain, email, token, backup, log
                 )
             )
-            self.worker.progress.connect(
-                lambda c, t, m: self.status_bar.show_progress(
-                    c, t, "Connecting...", m
-                )
-            )
+            self.worker.progress.connect(self.status_bar.show_progress)
             self.worker.log.connect(self.log_msg)
             self.worker.result.connect(self.on_connect_finished)
-            self.worker.start()
+            QThreadPool.globalInstance().start(self.worker)
 
     def on_connect_finished(self, success: bool, result: object):
         self.state_manager.force_reset()
@@ -1620,50 +1560,31 @@ class ZendeskWizard(QMainWindow):
             QMessageBox.critical(self, "Connection Error", str(result))
 
     def run_scan(self):
-        config = {
-            'fields': self.chk_scan_fields.isChecked(),
-            'forms': self.chk_scan_forms.isChecked(),
-            'user_fields': self.chk_scan_user_fields.isChecked(),
-            'org_fields': self.chk_scan_org_fields.isChecked(),
-            'macros': self.chk_scan_macros.isChecked(),
-            'triggers': self.chk_scan_triggers.isChecked(),
-            'automations': self.chk_scan_automations.isChecked(),
-            'views': self.chk_scan_views.isChecked(),
-            'sla_policies': self.chk_scan_sla_policies.isChecked(),
-            'custom_statuses': self.chk_scan_custom_statuses.isChecked(),
-            'groups': self.chk_scan_groups.isChecked(),
-            'cats': self.chk_scan_cats.isChecked(),
-            'sects': self.chk_scan_sects.isChecked(),
-            'arts': self.chk_scan_arts.isChecked(),
-            'refresh_dc': self.chk_refresh_dc.isChecked(),
-        }
-        self._last_scan_config = config
-
-        if not any(v for k, v in config.items() if k != 'refresh_dc'):
+        if not any(chk.isChecked() for _, chk in self._scan_checkboxes):
             QMessageBox.warning(
                 self, "Warning", "Select at least one item type to scan."
             )
             return
 
+        config = {key: chk.isChecked() for key, chk in self._scan_checkboxes}
+        config['refresh_dc'] = self.chk_refresh_dc.isChecked()
+        self._last_scan_config = config
+
         if not self.state_manager.try_transition(AppState.SCANNING):
             return
 
         self._cleanup_worker()
-        self.status_bar.show_progress(0, 0, "Scanning...", "")
+        self.status_bar.set_phase("Scanning...")
         self.lock_ui(True)
 
         with self._worker_lock:
             self.worker = StepWorker(
                 lambda p, log: self.controller.scan_and_analyze(p, log, config)
             )
-            self.worker.progress.connect(
-                lambda c, t, m: self.status_bar.show_progress(
-                    c, t, m, ""
-                )
-            )
+            self.worker.progress.connect(self.status_bar.show_progress)
             self.worker.log.connect(self.log_msg)
             self.worker.result.connect(self.on_scan_finished)
-            self.worker.start()
+            QThreadPool.globalInstance().start(self.worker)
 
     def on_scan_finished(self, success: bool, result: object):
         self.state_manager.force_reset()
@@ -1671,7 +1592,7 @@ class ZendeskWizard(QMainWindow):
 
         if not success:
             self.status_bar.finish("Failed", False)
-            if "Canceled" not in str(result):
+            if not isinstance(result, Canceled):
                 QMessageBox.critical(self, "Error", str(result))
             return
 
@@ -1687,69 +1608,51 @@ class ZendeskWizard(QMainWindow):
         self.status_bar.finish("Scan Complete", True)
         stats: Dict[str, int] = result  # type: ignore[assignment]
 
-        self.log_msg("=" * 50)
-        self.log_msg("SCAN RESULTS")
-        self.log_msg("=" * 50)
-        self.log_msg(f"Ticket Fields: {stats.get('valid_fields', 0)}")
-        self.log_msg(f"Ticket Forms: {stats.get('valid_forms', 0)}")
-        self.log_msg(f"Custom Statuses: {stats.get('valid_custom_statuses', 0)}")
-        self.log_msg(f"User Fields: {stats.get('valid_user_fields', 0)}")
-        self.log_msg(f"Organization Fields: {stats.get('valid_org_fields', 0)}")
-        self.log_msg(f"Groups: {stats.get('valid_groups', 0)}")
-        self.log_msg(f"Macros: {stats.get('valid_macros', 0)}")
-        self.log_msg(f"Triggers: {stats.get('valid_triggers', 0)}")
-        self.log_msg(f"Automations: {stats.get('valid_automations', 0)}")
-        self.log_msg(f"Views: {stats.get('valid_views', 0)}")
-        self.log_msg(f"SLA Policies: {stats.get('valid_sla_policies', 0)}")
-        self.log_msg(f"HC Categories: {stats.get('valid_cats', 0)}")
-        self.log_msg(f"HC Sections: {stats.get('valid_sects', 0)}")
-        self.log_msg(f"HC Articles: {stats.get('valid_arts', 0)}")
-        self.log_msg("-" * 50)
-        self.log_msg(f"TOTAL ITEMS: {len(self.controller.work_items)}")
-        self.log_msg(f"System Fields: {stats.get('system_excluded', 0)}")
-        self.log_msg("=" * 50)
+        values = defaultdict(int, stats)
+        values['total_items'] = len(self.controller.work_items)
+        self.log_msg(_SCAN_TEMPLATE.format_map(values))
 
         self.populate_preview(preserve_selection=False)
         self.goto(2)
 
     def _sync_preview_filters_to_scan(self):
         """Set Show checkboxes to match what was selected in the Scan tab."""
+        self._ensure_page(2)
         cfg = getattr(self, '_last_scan_config', {})
-        _chks = [
-            self.chk_filter_fields, self.chk_filter_forms,
-            self.chk_filter_statuses, self.chk_filter_user_fields,
-            self.chk_filter_org_fields, self.chk_filter_groups,
-            self.chk_filter_macros, self.chk_filter_triggers,
-            self.chk_filter_automations, self.chk_filter_views,
-            self.chk_filter_sla, self.chk_filter_hc_cats,
-            self.chk_filter_hc_sects, self.chk_filter_hc_arts,
-        ]
-        for chk in _chks:
-            chk.blockSignals(True)
-        self.chk_filter_fields.setChecked(cfg.get('fields', False))
-        self.chk_filter_forms.setChecked(cfg.get('forms', False))
-        self.chk_filter_statuses.setChecked(cfg.get('custom_statuses', False))
-        self.chk_filter_user_fields.setChecked(cfg.get('user_fields', False))
-        self.chk_filter_org_fields.setChecked(cfg.get('org_fields', False))
-        self.chk_filter_groups.setChecked(cfg.get('groups', False))
-        self.chk_filter_macros.setChecked(cfg.get('macros', False))
-        self.chk_filter_triggers.setChecked(cfg.get('triggers', False))
-        self.chk_filter_automations.setChecked(cfg.get('automations', False))
-        self.chk_filter_views.setChecked(cfg.get('views', False))
-        self.chk_filter_sla.setChecked(cfg.get('sla_policies', False))
-        self.chk_filter_hc_cats.setChecked(cfg.get('cats', False))
-        self.chk_filter_hc_sects.setChecked(cfg.get('sects', False))
-        self.chk_filter_hc_arts.setChecked(cfg.get('arts', False))
-        for chk in _chks:
-            chk.blockSignals(False)
+        pairs = (
+            (self.chk_filter_fields, 'fields'),
+            (self.chk_filter_forms, 'forms'),
+            (self.chk_filter_statuses, 'custom_statuses'),
+            (self.chk_filter_user_fields, 'user_fields'),
+            (self.chk_filter_org_fields, 'org_fields'),
+            (self.chk_filter_groups, 'groups'),
+            (self.chk_filter_macros, 'macros'),
+            (self.chk_filter_triggers, 'triggers'),
+            (self.chk_filter_automations, 'automations'),
+            (self.chk_filter_views, 'views'),
+            (self.chk_filter_sla, 'sla_policies'),
+            (self.chk_filter_hc_cats, 'cats'),
+            (self.chk_filter_hc_sects, 'sects'),
+            (self.chk_filter_hc_arts, 'arts'),
+        )
+        for chk, key in pairs:
+            with QSignalBlocker(chk):
+                chk.setChecked(cfg.get(key, False))
         # System items are always shown regardless of scan selection
 
     def populate_preview(self, preserve_selection: bool = True):
-        self._work_items_cache = [dict(item) for item in self.controller.work_items]
+        self._ensure_page(2)
+        # Share the controller's item dicts rather than copying each one;
+        # the table model writes cell edits straight into them, so the
+        # controller sees every edit without a second write. The list itself
+        # only changes on a new scan; translations update the dicts in place.
+        version = self.controller.work_items_version
+        if version != self._work_items_version:
+            self._work_items_cache = list(self.controller.work_items)
+            self._work_items_version = version
         if not preserve_selection:
-            self.txt_search_filter.blockSignals(True)
-            self.txt_search_filter.clear()
-            self.txt_search_filter.blockSignals(False)
+            with QSignalBlocker(self.txt_search_filter):
+                self.txt_search_filter.clear()
 
         selection_state = None
         if preserve_selection:
@@ -1784,31 +1687,19 @@ class ZendeskWizard(QMainWindow):
 
         visible_count = len(self.preview_table.get_visible_data_indices())
         total_count = len(self.preview_table._data)
-        self.lbl_sum_showing.setText(
-            f"Showing: {visible_count} / {total_count}"
-        )
-
-        selected_count = self.preview_table.get_selected_count()
-        self.lbl_sum_selected.setText(f"Selected: {selected_count}")
+        self._set_summary(showing=visible_count, total=total_count)
         self._update_will_translate_label()
 
+    # The table's selection_changed signal refreshes the summary and the
+    # will-translate label after each of these.
     def _select_all_visible(self):
         self.preview_table.select_all_visible()
-        selected_count = self.preview_table.get_selected_count()
-        self.lbl_sum_selected.setText(f"Selected: {selected_count}")
-        self._update_will_translate_label()
 
     def _deselect_all_visible(self):
         self.preview_table.deselect_all_visible()
-        selected_count = self.preview_table.get_selected_count()
-        self.lbl_sum_selected.setText(f"Selected: {selected_count}")
-        self._update_will_translate_label()
 
     def _invert_selection(self):
         self.preview_table.invert_selection_visible()
-        selected_count = self.preview_table.get_selected_count()
-        self.lbl_sum_selected.setText(f"Selected: {selected_count}")
-        self._update_will_translate_label()
 
     def _get_visible_selected_indices(self) -> List[int]:
         selected_rows = self.preview_table.get_selected_rows()
@@ -1841,7 +1732,7 @@ class ZendeskWizard(QMainWindow):
         force = self.chk_force_translate.isChecked()
 
         self._cleanup_worker()
-        self.status_bar.show_progress(0, 0, "Translating...", "")
+        self.status_bar.set_phase("Translating...")
         self.lock_ui(True)
 
         with self._worker_lock:
@@ -1850,14 +1741,10 @@ class ZendeskWizard(QMainWindow):
                     p, log, selected_indices, force
                 )
             )
-            self.worker.progress.connect(
-                lambda c, t, m: self.status_bar.show_progress(
-                    c, t, "Translating...", m
-                )
-            )
+            self.worker.progress.connect(self.status_bar.show_progress)
             self.worker.log.connect(self.log_msg)
             self.worker.result.connect(self.on_translation_finished)
-            self.worker.start()
+            QThreadPool.globalInstance().start(self.worker)
 
     def on_translation_finished(self, success: bool, result: object):
         self.state_manager.force_reset()
@@ -1865,63 +1752,51 @@ class ZendeskWizard(QMainWindow):
 
         if not success:
             self.status_bar.finish("Failed", False)
-            if "Canceled" not in str(result):
+            if not isinstance(result, Canceled):
                 QMessageBox.critical(self, "Error", str(result))
             return
 
         self.status_bar.finish("Translation Complete", True)
         stats: TranslationStats = result  # type: ignore[assignment]
 
-        self.log_msg("=" * 50)
-        self.log_msg("TRANSLATION RESULTS")
-        self.log_msg("=" * 50)
-        self.log_msg(f"Total: {stats.total}")
-        self.log_msg(f"Translated: {stats.translated}")
-        self.log_msg(f"From Cache: {stats.from_cache}")
-        self.log_msg(f"Failed: {stats.failed}")
-        self.log_msg(f"Success Rate: {stats.success_rate:.1f}%")
-        self.log_msg("=" * 50)
+        self.log_block([
+            _SEP,
+            "TRANSLATION RESULTS",
+            _SEP,
+            f"Total: {stats.total}",
+            f"Translated: {stats.translated}",
+            f"From Cache: {stats.from_cache}",
+            f"Failed: {stats.failed}",
+            f"Success Rate: {stats.success_rate:.1f}%",
+            _SEP,
+        ])
 
         self.populate_preview(preserve_selection=True)
 
     def _log_apply_summary(self):
-        selected_rows = self.preview_table.get_selected_rows()
-
-        selected_items = []
-        for row in selected_rows:
-            if row < len(self._work_items_cache):
-                selected_items.append(self._work_items_cache[row])
-
-        non_system_selected = [
-            i for i in selected_items if not i.get('is_system', False)
-        ]
-
-        ready = sum(
-            1 for i in non_system_selected if i.get('en') and i.get('es')
+        selected, ready = self.preview_table.count_ready(
+            self.preview_table.get_selected_rows()
         )
-        pending = len(non_system_selected) - ready
-
-        self.log_msg("=" * 50)
-        self.log_msg("APPLY SUMMARY")
-        self.log_msg("=" * 50)
-        self.log_msg(f"Selected: {len(non_system_selected)} items")
-        self.log_msg(f"Ready to apply: {ready}")
-        self.log_msg(f"Still need translation: {pending}")
-        self.log_msg("=" * 50)
+        pending = selected - ready
+
+        self.log_block([
+            _SEP,
+            "APPLY SUMMARY",
+            _SEP,
+            f"Selected: {selected} items",
+            f"Ready to apply: {ready}",
+            f"Still need translation: {pending}",
+            _SEP,
+        ])
 
     def _get_selected_items(self) -> List[Dict[str, Any]]:
-        """Get selected items with force_update flag."""
-        selected_rows = self.preview_table.get_selected_rows()
-        force_update = self.chk_update_existing_dc.isChecked()
-
-        selected_items = []
-        for row in selected_rows:
-            if row < len(self._work_items_cache):
-                item = self._work_items_cache[row].copy()
-                item['force_update'] = force_update
-                selected_items.append(item)
-
-        return selected_items
+        """Get the selected work items (shared, not copied)."""
+        cache = self._work_items_cache
+        size = len(cache)
+        return [
+            cache[row] for row in self.preview_table.get_selected_rows()
+            if row < size
+        ]
 
     def run_apply(self):
         selected = self._get_selected_items()
@@ -1937,14 +1812,14 @@ class ZendeskWizard(QMainWindow):
             )
             return
 
-        not_ready = [
-            i for i in non_system_selected
-            if not i.get('en') or not i.get('es')
-        ]
+        _, ready = self.preview_table.count_ready(
+            self.preview_table.get_selected_rows()
+        )
+        not_ready = len(non_system_selected) - ready
         if not_ready:
             reply = QMessageBox.question(
                 self, "Incomplete Translations",
-                f"{len(not_ready)} item(s) don't have complete translations.\n"
+                f"{not_ready} item(s) don't have complete translations.\n"
                 f"Continue anyway?",
                 QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
             )
@@ -1971,31 +1846,32 @@ class ZendeskWizard(QMainWindow):
             return
 
         self._cleanup_worker()
-        self.status_bar.show_progress(0, 0, "Applying...", "")
+        self.status_bar.set_phase("Applying...")
         self.lock_ui(True)
 
         with self._worker_lock:
             self.worker = StepWorker(
                 lambda p, log: self.controller.execute_changes(
-                    non_system_selected, p, log
-                )
-            )
-            self.worker.progress.connect(
-                lambda c, t, m: self.status_bar.show_progress(
-                    c, t, "Applying...", m
+                    non_system_selected, p, log, update_existing
                 )
             )
+            self.worker.progress.connect(self.status_bar.show_progress)
             self.worker.log.connect(self.log_msg)
             self.worker.result.connect(self.on_apply_finished)
-            self.worker.start()
+            QThreadPool.globalInstance().start(self.worker)
 
     def on_apply_finished(self, success: bool, result: object):
         self.state_manager.force_reset()
         self.lock_ui(False)
+        # The apply writes dc_id, action, already_linked etc. straight into
+        # the preview's item dicts (also on failure or cancel, for the items
+        # it reached), so rebuild the model's caches and summary counts.
+        self.populate_preview(preserve_selection=True)
+        self._update_apply_summary()
 
         if not success:
             self.status_bar.finish("Failed", False)
-            if "Canceled" not in str(result):
+            if not isinstance(result, Canceled):
                 QMessageBox.critical(self, "Error", str(result))
             return
 
@@ -2006,14 +1882,17 @@ class ZendeskWizard(QMainWindow):
             failed_count = len(result.get('failed', []))
             backup_file = result.get('backup_file', '')
 
-            self.log_msg("=" * 50)
-            self.log_msg("APPLY RESULTS")
-            self.log_msg("=" * 50)
-            self.log_msg(f"Succeeded: {success_count}")
-            self.log_msg(f"Failed: {failed_count}")
+            lines = [
+                _SEP,
+                "APPLY RESULTS",
+                _SEP,
+                f"Succeeded: {success_count}",
+                f"Failed: {failed_count}",
+            ]
             if backup_file:
-                self.log_msg(f"Backup: {backup_file}")
-            self.log_msg("=" * 50)
+                lines.append(f"Backup: {backup_file}")
+            lines.append(_SEP)
+            self.log_block(lines)
 
             if failed_count > 0:
                 QMessageBox.warning(
@@ -2041,21 +1920,17 @@ class ZendeskWizard(QMainWindow):
             return
 
         self._cleanup_worker()
-        self.status_bar.show_progress(0, 0, "Loading backup...", "")
+        self.status_bar.set_phase("Loading backup...")
         self.lock_ui(True)
 
         with self._worker_lock:
             self.worker = StepWorker(
                 lambda p, log: self.controller.load_backup_thread(p, log, filepath)
             )
-            self.worker.progress.connect(
-                lambda c, t, m: self.status_bar.show_progress(
-                    c, t, "Loading...", m
-                )
-            )
+            self.worker.progress.connect(self.status_bar.show_progress)
             self.worker.log.connect(self.log_msg)
             self.worker.result.connect(self.on_load_backup_finished)
-            self.worker.start()
+            QThreadPool.globalInstance().start(self.worker)
 
     def on_load_backup_finished(self, success: bool, result: object):
         self.state_manager.force_reset()
@@ -2073,17 +1948,16 @@ class ZendeskWizard(QMainWindow):
         items: List[Dict[str, Any]] = backup_data.get('items', [])
         self._pending_backup_items = items
 
-        type_counts: Dict[str, int] = {}
-        for item in items:
-            t = item.get('type', 'unknown')
-            type_counts[t] = type_counts.get(t, 0) + 1
+        type_counts = Counter(item.get('type', 'unknown') for item in items)
+        type_lines = [
+            f"  {t}: {count}" for t, count in sorted(type_counts.items())
+        ]
 
-        self.log_msg("=" * 50)
-        self.log_msg(f"BACKUP LOADED: {len(items)} items")
-        self.log_msg("=" * 50)
-        for t, count in sorted(type_counts.items()):
-            self.log_msg(f"  {t}: {count}")
-        self.log_msg("=" * 50)
+        self.log_block(
+            [_SEP, f"BACKUP LOADED: {len(items)} items", _SEP]
+            + type_lines
+            + [_SEP]
+        )
 
         # Format timestamp for display (YYYYMMDD_HHMMSS → YYYY-MM-DD HH:MM:SS)
         ts_display = timestamp
@@ -2093,23 +1967,21 @@ class ZendeskWizard(QMainWindow):
 
         lines = [f"Backup: {ts_display}" if ts_display else "Backup loaded"]
         lines.append(f"Total items: {len(items)}\n")
-        for t, count in sorted(type_counts.items()):
-            lines.append(f"  {t}: {count}")
+        lines.extend(type_lines)
 
         # Show up to 20 field names as sample
-        field_names = []
-        for item in items[:20]:
-            fn = item.get('field_name') or item.get('current_value', '')
-            if fn and fn not in field_names:
-                field_names.append(fn)
+        field_names = list(dict.fromkeys(
+            item.get('field_name') or item.get('current_value', '')
+            for item in items[:20]
+        ))
+        field_names = [fn for fn in field_names if fn]
         if field_names:
             lines.append("\nSample fields to restore:")
-            for fn in field_names[:10]:
-                lines.append(f"  • {fn}")
+            lines.extend(f"  • {fn}" for fn in field_names[:10])
             if len(items) > 20:
                 lines.append(f"  … and {len(items) - 20} more")
 
-        self.rollback_info.setText("\n".join(lines))
+        self.rollback_info.setPlainText("\n".join(lines))
         self.btn_rollback.setEnabled(True)
 
     def run_rollback(self):
@@ -2132,7 +2004,7 @@ class ZendeskWizard(QMainWindow):
             return
 
         self._cleanup_worker()
-        self.status_bar.show_progress(0, 0, "Rolling back...", "")
+        self.status_bar.set_phase("Rolling back...")
         self.lock_ui(True)
 
         with self._worker_lock:
@@ -2141,14 +2013,10 @@ class ZendeskWizard(QMainWindow):
                     self._pending_backup_items, p, log
                 )
             )
-            self.worker.progress.connect(
-                lambda c, t, m: self.status_bar.show_progress(
-                    c, t, "Rolling back...", m
-                )
-            )
+            self.worker.progress.connect(self.status_bar.show_progress)
             self.worker.log.connect(self.log_msg)
             self.worker.result.connect(self.on_rollback_finished)
-            self.worker.start()
+            QThreadPool.globalInstance().start(self.worker)
 
     def on_rollback_finished(self, success: bool, result: object):
         self.state_manager.force_reset()
@@ -2156,15 +2024,12 @@ class ZendeskWizard(QMainWindow):
 
         if not success:
             self.status_bar.finish("Failed", False)
-            if "Canceled" not in str(result):
+            if not isinstance(result, Canceled):
                 QMessageBox.critical(self, "Error", str(result))
             return
 
         self.status_bar.finish("Rollback Complete", True)
-        self.log_msg("=" * 50)
-        self.log_msg("ROLLBACK COMPLETE")
-        self.log_msg(str(result))
-        self.log_msg("=" * 50)
+        self.log_block([_SEP, "ROLLBACK COMPLETE", str(result), _SEP])
         QMessageBox.information(self, "Success", str(result))
 
     def run_clear_cache(self):
@@ -2190,7 +2055,8 @@ class ZendeskWizard(QMainWindow):
 
     def closeEvent(self, event):
         self._cleanup_worker()
-        self.preview_table.cancel_loading()
+        if hasattr(self, 'preview_table'):
+            self.preview_table.cancel_loading()
         self.controller.cleanup()
         self.status_bar.stop_timer()
         event.accept()
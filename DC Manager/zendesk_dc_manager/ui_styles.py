@@ -7,6 +7,7 @@ This module provides:
 - Main application stylesheet
 """
 
+import functools
 import sys
 
 from PyQt6.QtGui import QColor
@@ -24,6 +25,7 @@ from zendesk_dc_manager.config import (
     TEXT_COLORS,
     PLACEHOLDER_COLORS,
     PLACEHOLDER_TEXT_COLORS,
+    LOG_COLORS,
 )
 
 
@@ -32,6 +34,7 @@ from zendesk_dc_manager.config import (
 # ==============================================================================
 
 
+@functools.lru_cache(maxsize=None)
 def get_platform_font() -> str:
     """Get the appropriate font family for the current platform."""
     if sys.platform == 'darwin':
@@ -42,6 +45,7 @@ def get_platform_font() -> str:
         return 'DejaVu Sans'
 
 
+@functools.lru_cache(maxsize=None)
 def get_monospace_font() -> str:
     """Get the appropriate monospace font for the current platform."""
     if sys.platform == 'darwin':
@@ -57,30 +61,36 @@ def get_monospace_font() -> str:
 # ==============================================================================
 
 
+# Hex strings resolved to QColor once at import; the table model asks for
+# these for every visible cell on each repaint.
+_SOURCE_QCOLORS = {k: QColor(v) for k, v in SOURCE_COLORS.items()}
+_TEXT_QCOLORS = {k: QColor(v) for k, v in TEXT_COLORS.items()}
+_PLACEHOLDER_QCOLORS = {k: QColor(v) for k, v in PLACEHOLDER_COLORS.items()}
+_PLACEHOLDER_TEXT_QCOLORS = {
+    k: QColor(v) for k, v in PLACEHOLDER_TEXT_COLORS.items()
+}
+
+
 def get_source_color(source: str) -> QColor:
     """Get background color for a source type."""
-    hex_color = SOURCE_COLORS.get(source, SOURCE_COLORS[SOURCE_NEW])
-    return QColor(hex_color)
+    return _SOURCE_QCOLORS.get(source, _SOURCE_QCOLORS[SOURCE_NEW])
 
 
 def get_text_color(source: str) -> QColor:
     """Get text color for a source type."""
-    hex_color = TEXT_COLORS.get(source, TEXT_COLORS[SOURCE_NEW])
-    return QColor(hex_color)
+    return _TEXT_QCOLORS.get(source, _TEXT_QCOLORS[SOURCE_NEW])
 
 
 def get_placeholder_color(source: str) -> QColor:
     """Get background color for a placeholder source type."""
-    hex_color = PLACEHOLDER_COLORS.get(source, PLACEHOLDER_COLORS['proposed'])
-    return QColor(hex_color)
+    return _PLACEHOLDER_QCOLORS.get(source, _PLACEHOLDER_QCOLORS['proposed'])
 
 
 def get_placeholder_text_color(source: str) -> QColor:
     """Get text color for a placeholder source type."""
-    hex_color = PLACEHOLDER_TEXT_COLORS.get(
-        source, PLACEHOLDER_TEXT_COLORS['proposed']
+    return _PLACEHOLDER_TEXT_QCOLORS.get(
+        source, _PLACEHOLDER_TEXT_QCOLORS['proposed']
     )
-    return QColor(hex_color)
 
 
 # ==============================================================================
@@ -88,9 +98,11 @@ def get_placeholder_text_color(source: str) -> QColor:
 # ==============================================================================
 
 
+@functools.lru_cache(maxsize=1)
 def get_main_stylesheet() -> str:
-    """Get main application stylesheet."""
+    """Get main application stylesheet (built once, then cached)."""
     font_family = get_platform_font()
+    monospace_font = get_monospace_font()
 
     return f"""
         QMainWindow {{
@@ -118,7 +130,7 @@ def get_main_stylesheet() -> str:
             color: #374151;
         }}
 
-        QLineEdit, QTextEdit, QSpinBox, QComboBox {{
+        QLineEdit, QTextEdit, QPlainTextEdit, QSpinBox, QComboBox {{
             border: 1px solid #D1D5DB;
             border-radius: 6px;
             padding: 8px 12px;
@@ -126,12 +138,13 @@ def get_main_stylesheet() -> str:
             selection-background-color: #3B82F6;
         }}
 
-        QLineEdit:focus, QTextEdit:focus, QSpinBox:focus, QComboBox:focus {{
+        QLineEdit:focus, QTextEdit:focus, QPlainTextEdit:focus,
+        QSpinBox:focus, QComboBox:focus {{
             border-color: #3B82F6;
             outline: none;
         }}
 
-        QLineEdit:disabled, QTextEdit:disabled {{
+        QLineEdit:disabled, QTextEdit:disabled, QPlainTextEdit:disabled {{
             background-color: #F3F4F6;
             color: #9CA3AF;
         }}
@@ -319,5 +332,194 @@ def get_main_stylesheet() -> str:
         QLabel {{
             color: #374151;
         }}
+
+        QPushButton#toggleButton {{
+            background-color: #E5E7EB;
+            border: 1px solid #D1D5DB;
+            border-radius: 4px;
+            padding: 6px 12px;
+        }}
+
+        QPushButton#toggleButton:checked {{
+            background-color: #DBEAFE;
+            border-color: #3B82F6;
+        }}
+
+        QPushButton#toggleButton:hover {{
+            background-color: #D1D5DB;
+        }}
+
+        QPushButton#connectButton {{
+            background-color: #3B82F6;
+            color: white;
+            border: none;
+            border-radius: 6px;
+            padding: 10px 24px;
+            font-weight: 600;
+            font-size: 14px;
+        }}
+
+        QPushButton#connectButton:hover {{
+            background-color: #2563EB;
+        }}
+
+        QPushButton#connectButton:pressed {{
+            background-color: #1D4ED8;
+        }}
+
+        QPushButton#scanButton {{
+            background-color: #3B82F6;
+            color: white;
+            border: none;
+            border-radius: 6px;
+            padding: 10px 24px;
+            font-weight: 600;
+        }}
+
+        QPushButton#scanButton:hover {{
+            background-color: #2563EB;
+        }}
+
+        QPushButton#translateButton {{
+            background-color: #059669;
+            color: white;
+            border: none;
+            border-radius: 5px;
+            padding: 6px 16px;
+            font-weight: 600;
+            font-size: 12px;
+        }}
+
+        QPushButton#translateButton:hover {{
+            background-color: #047857;
+        }}
+
+        QPushButton#applyButton, QPushButton#rollbackButton {{
+            background-color: #DC2626;
+            color: white;
+            border: none;
+            border-radius: 6px;
+            padding: 10px 24px;
+            font-weight: 600;
+        }}
+
+        QPushButton#applyButton:hover, QPushButton#rollbackButton:hover {{
+            background-color: #B91C1C;
+        }}
+
+        QPushButton#rollbackButton:disabled {{
+            background-color: #9CA3AF;
+        }}
+
+        QLabel#logTitle {{
+            font-weight: bold;
+            color: #374151;
+        }}
+
+        QPushButton#clearLogButton {{
+            background-color: #4B5563;
+            color: white;
+            border: none;
+            border-radius: 4px;
+            font-size: 11px;
+            padding: 4px 12px;
+        }}
+
+        QPushButton#clearLogButton:hover {{
+            background-color: #6B7280;
+        }}
+
+        QPlainTextEdit#logOutput {{
+            background-color: {LOG_COLORS['background']};
+            color: {LOG_COLORS['text']};
+            font-family: "{monospace_font}";
+            font-size: 11px;
+            border: 1px solid {LOG_COLORS['border']};
+            border-radius: 4px;
+            padding: 8px;
+        }}
+
+        QPlainTextEdit#logOutput QScrollBar:vertical {{
+            background-color: #2a2a2a;
+            width: 14px;
+            border: none;
+        }}
+
+        QPlainTextEdit#logOutput QScrollBar::handle:vertical {{
+            background-color: #555;
+            min-height: 30px;
+            border-radius: 4px;
+            margin: 2px;
+        }}
+
+        QPlainTextEdit#logOutput QScrollBar::handle:vertical:hover {{
+            background-color: #666;
+        }}
+
+        QPlainTextEdit#logOutput QScrollBar::add-line:vertical,
+        QPlainTextEdit#logOutput QScrollBar::sub-line:vertical {{
+            height: 0px;
+        }}
+
+        QPlainTextEdit#logOutput QScrollBar::add-page:vertical,
+        QPlainTextEdit#logOutput QScrollBar::sub-page:vertical {{
+            background-color: #2a2a2a;
+        }}
+
+        QWidget#embeddedStatusBar {{
+            background-color: #F3F4F6;
+            border-top: 1px solid #E5E7EB;
+        }}
+
+        QLabel#statusLabel {{
+            background: transparent;
+            color: #374151;
+            font-weight: 500;
+        }}
+
+        QLabel#statusLabel[state="success"] {{
+            color: #059669;
+        }}
+
+        QLabel#statusLabel[state="failed"] {{
+            color: #DC2626;
+        }}
+
+        QLabel#statusDetail {{
+            background: transparent;
+            color: #6B7280;
+            font-size: 12px;
+        }}
+
+        QLabel#statusEta {{
+            background: transparent;
+            color: #059669;
+            font-size: 12px;
+            font-weight: 500;
+        }}
+
+        QProgressBar#statusProgress {{
+            border: none;
+            border-radius: 4px;
+            background-color: #E5E7EB;
+        }}
+
+        QProgressBar#statusProgress::chunk {{
+            background-color: #3B82F6;
+            border-radius: 4px;
+        }}
+
+        QPushButton#cancelButton {{
+            background-color: #EF4444;
+            color: white;
+            border: none;
+            border-radius: 4px;
+            padding: 6px 12px;
+            font-weight: 500;
+        }}
+
+        QPushButton#cancelButton:hover {{
+            background-color: #DC2626;
+        }}
     """
 
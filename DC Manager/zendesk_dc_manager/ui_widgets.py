@@ -2,7 +2,7 @@
 Custom widgets for Zendesk DC Manager UI.
 
 This module provides:
-- StepWorker: Thread worker for long-running operations
+- StepWorker: Thread-pool task for long-running operations
 - DarkConsoleWidget: Log output console with dark theme
 - EmbeddedStatusBar: Progress bar with cancel button and ETA
 - TableContainer: Container for table widget
@@ -11,16 +11,18 @@ This module provides:
 """
 
 import threading
-from typing import Optional, List, Dict, Any
+from collections import Counter, deque
+from itertools import compress
+from typing import Optional, List, Dict, Any, Tuple
 
 from PyQt6.QtCore import (
-    Qt, QTimer, pyqtSignal, QThread, QElapsedTimer,
+    Qt, QTimer, pyqtSignal, QObject, QRunnable, QElapsedTimer,
     QAbstractTableModel, QModelIndex,
 )
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel,
     QPushButton, QProgressBar, QTableView,
-    QHeaderView, QAbstractItemView, QTextEdit,
+    QHeaderView, QAbstractItemView, QPlainTextEdit,
     QStyledItemDelegate, QStyleOptionViewItem, QStyle,
     QLineEdit, QMenu, QApplication,
 )
@@ -28,7 +30,6 @@ from PyQt6.QtGui import QBrush, QFontMetrics, QAction
 
 from zendesk_dc_manager.config import (
     UI_CONFIG,
-    LOG_COLORS,
     SOURCE_NEW,
     SOURCE_ZENDESK_DC,
     SOURCE_TRANSLATED,
@@ -37,9 +38,12 @@ from zendesk_dc_manager.config import (
     SOURCE_MANUAL,
     SOURCE_ATTENTION,
     SOURCE_RESERVED,
+    SOURCE_COLORS,
+    TEXT_COLORS,
+    PLACEHOLDER_COLORS,
+    PLACEHOLDER_TEXT_COLORS,
 )
 from zendesk_dc_manager.ui_styles import (
-    get_monospace_font,
     get_source_color as _get_source_color,
     get_text_color as _get_text_color,
     get_placeholder_color as _get_placeholder_color,
@@ -52,35 +56,58 @@ from zendesk_dc_manager.ui_styles import (
 # ==============================================================================
 
 
-class StepWorker(QThread):
-    """Worker thread for long-running operations."""
+class _StepSignals(QObject):
+    """Signal carrier for StepWorker (QRunnable cannot own signals)."""
 
     progress = pyqtSignal(int, int, str)
     log = pyqtSignal(str)
     result = pyqtSignal(bool, object)
 
-    def __init__(self, task_func, parent=None):
-        super().__init__(parent)
+
+class StepWorker(QRunnable):
+    """Long-running operation run on QThreadPool.globalInstance().
+
+    Pooled threads are reused across operations instead of starting a
+    new OS thread per click.
+    """
+
+    def __init__(self, task_func):
+        super().__init__()
+        # The window holds the Python reference; keep the pool from
+        # deleting the C++ object out from under it after run().
+        self.setAutoDelete(False)
         self._task_func = task_func
-        self._canceled = False
-        self._cancel_lock = threading.Lock()
+        self._signals = _StepSignals()
+        self.progress = self._signals.progress
+        self.log = self._signals.log
+        self.result = self._signals.result
+        # Set once on cancel; run() checks it (a lock-free read) to drop
+        # the result of a canceled task. The task itself stops through the
+        # controller's own stop flag.
+        self._cancel_event = threading.Event()
+        # Set when run() returns, so this worker can be waited on without
+        # waiting for the rest of the shared pool.
+        self._done = threading.Event()
 
     def run(self):
         try:
             result = self._task_func(self.progress, self.log)
-            if not self._is_canceled():
+            if not self._cancel_event.is_set():
                 self.result.emit(True, result)
         except Exception as e:
-            if not self._is_canceled():
-                self.result.emit(False, str(e))
+            # The exception itself is passed on so handlers can tell a
+            # Canceled apart from a real failure by type.
+            if not self._cancel_event.is_set():
+                self.result.emit(False, e)
+        finally:
+            self._done.set()
 
     def cancel(self):
-        with self._cancel_lock:
-            self._canceled = True
+        self._cancel_event.set()
 
-    def _is_canceled(self) -> bool:
-        with self._cancel_lock:
-            return self._canceled
+    def wait(self, timeout_ms: int) -> bool:
+        """Block until run() has finished; False on timeout."""
+        return self._done.wait(timeout_ms / 1000.0)
 
 
 # ==============================================================================
@@ -102,7 +129,7 @@ class DarkConsoleWidget(QWidget):
         header.setContentsMargins(0, 0, 0, 0)
 
         title = QLabel("Log Output")
-        title.setStyleSheet("font-weight: bold; color: #374151;")
+        title.setObjectName("logTitle")
         header.addWidget(title)
 
         header.addStretch()
@@ -110,74 +137,63 @@ class DarkConsoleWidget(QWidget):
         self.btn_clear = QPushButton("Clear Log")
         self.btn_clear.setMinimumWidth(90)
         self.btn_clear.setFixedHeight(26)
-        self.btn_clear.setStyleSheet("""
-            QPushButton {
-                background-color: #4B5563;
-                color: white;
-                border: none;
-                border-radius: 4px;
-                font-size: 11px;
-                padding: 4px 12px;
-            }
-            QPushButton:hover {
-                background-color: #6B7280;
-            }
-        """)
+        self.btn_clear.setObjectName("clearLogButton")
         self.btn_clear.clicked.connect(self.clear)
         header.addWidget(self.btn_clear)
 
         layout.addLayout(header)
 
-        monospace_font = get_monospace_font()
-
-        self.text_edit = QTextEdit()
+        # Plain-text log with a capped block count, so long runs neither
+        # grow memory without bound nor pay for rich-text layout.
+        self.text_edit = QPlainTextEdit()
         self.text_edit.setReadOnly(True)
-        self.text_edit.setStyleSheet(f"""
-            QTextEdit {{
-                background-color: {LOG_COLORS['background']};
-                color: {LOG_COLORS['text']};
-                font-family: "{monospace_font}";
-                font-size: 11px;
-                border: 1px solid {LOG_COLORS['border']};
-                border-radius: 4px;
-                padding: 8px;
-            }}
-            QScrollBar:vertical {{
-                background-color: #2a2a2a;
-                width: 14px;
-                border: none;
-            }}
-            QScrollBar::handle:vertical {{
-                background-color: #555;
-                min-height: 30px;
-                border-radius: 4px;
-                margin: 2px;
-            }}
-            QScrollBar::handle:vertical:hover {{
-                background-color: #666;
-            }}
-            QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {{
-                height: 0px;
-            }}
-            QScrollBar::add-page:vertical, QScrollBar::sub-page:vertical {{
-                background-color: #2a2a2a;
-            }}
-        """)
+        self.text_edit.setMaximumBlockCount(UI_CONFIG.LOG_MAX_BLOCKS)
+        self.text_edit.setObjectName("logOutput")
         layout.addWidget(self.text_edit)
 
+        # Lines queued since the last flush; a burst of appends becomes a
+        # single insert, layout and scroll. While the console is hidden the
+        # queue is held back (capped like the document) until it is shown.
+        self._pending: deque = deque(maxlen=UI_CONFIG.LOG_MAX_BLOCKS)
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(UI_CONFIG.LOG_FLUSH_MS)
+        self._flush_timer.timeout.connect(self._flush)
+
     def append(self, text: str):
-        """Append text to the console and scroll to bottom."""
-        self.text_edit.append(text)
+        """Queue text for the console; it is written on the next flush."""
+        self._pending.append(text)
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
+
+    def _flush(self):
+        """Write queued text in one append and scroll to bottom."""
+        if not self._pending or not self.isVisible():
+            return
+        text = "\n".join(self._pending)
+        self._pending.clear()
+        self.text_edit.appendPlainText(text)
         scrollbar = self.text_edit.verticalScrollBar()
         scrollbar.setValue(scrollbar.maximum())
 
+    def showEvent(self, event):
+        super().showEvent(event)
+        self._flush()
+
     def clear(self):
         """Clear all text from the console."""
+        self._pending.clear()
+        self._flush_timer.stop()
         self.text_edit.clear()
 
     def toPlainText(self) -> str:
         """Get all text from the console."""
-        return self.text_edit.toPlainText()
+        self._flush()
+        text = self.text_edit.toPlainText()
+        if not self._pending:
+            return text
+        # Hidden console: include the text not yet written to the widget.
+        return "\n".join([text, *self._pending] if text else self._pending)
 
 
 # ==============================================================================
@@ -195,21 +211,12 @@ class EmbeddedStatusBar(QWidget):
         self.setObjectName("embeddedStatusBar")
         self.setFixedHeight(UI_CONFIG.STATUS_BAR_HEIGHT)
 
-        self.setStyleSheet("""
-            QWidget#embeddedStatusBar {
-                background-color: #F3F4F6;
-                border-top: 1px solid #E5E7EB;
-            }
-        """)
-
         layout = QHBoxLayout(self)
         layout.setContentsMargins(16, 8, 16, 8)
         layout.setSpacing(12)
 
         self.lbl_status = QLabel("Ready")
-        self.lbl_status.setStyleSheet(
-            "background: transparent; color: #374151; font-weight: 500;"
-        )
+        self.lbl_status.setObjectName("statusLabel")
         layout.addWidget(self.lbl_status)
 
         self.progress_bar = QProgressBar()
@@ -217,62 +224,31 @@ class EmbeddedStatusBar(QWidget):
         self.progress_bar.setFixedHeight(8)
         self.progress_bar.setVisible(False)
         self.progress_bar.setTextVisible(False)
-        self.progress_bar.setStyleSheet("""
-            QProgressBar {
-                border: none;
-                border-radius: 4px;
-                background-color: #E5E7EB;
-            }
-            QProgressBar::chunk {
-                background-color: #3B82F6;
-                border-radius: 4px;
-            }
-        """)
+        self.progress_bar.setObjectName("statusProgress")
         layout.addWidget(self.progress_bar)
 
         self.lbl_progress_detail = QLabel("")
-        self.lbl_progress_detail.setStyleSheet(
-            "background: transparent; color: #6B7280; font-size: 12px;"
-        )
+        self.lbl_progress_detail.setObjectName("statusDetail")
         layout.addWidget(self.lbl_progress_detail)
 
         self.lbl_detail = QLabel("")
-        self.lbl_detail.setStyleSheet(
-            "background: transparent; color: #6B7280; font-size: 12px;"
-        )
+        self.lbl_detail.setObjectName("statusDetail")
         layout.addWidget(self.lbl_detail)
 
         layout.addStretch()
 
         self.lbl_timer = QLabel("")
-        self.lbl_timer.setStyleSheet(
-            "background: transparent; color: #6B7280; font-size: 12px;"
-        )
+        self.lbl_timer.setObjectName("statusDetail")
         layout.addWidget(self.lbl_timer)
 
         self.lbl_eta = QLabel("")
-        self.lbl_eta.setStyleSheet(
-            "background: transparent; color: #059669; "
-            "font-size: 12px; font-weight: 500;"
-        )
+        self.lbl_eta.setObjectName("statusEta")
         layout.addWidget(self.lbl_eta)
 
         self.btn_cancel = QPushButton("Cancel")
         self.btn_cancel.setFixedWidth(80)
         self.btn_cancel.setVisible(False)
-        self.btn_cancel.setStyleSheet("""
-            QPushButton {
-                background-color: #EF4444;
-                color: white;
-                border: none;
-                border-radius: 4px;
-                padding: 6px 12px;
-                font-weight: 500;
-            }
-            QPushButton:hover {
-                background-color: #DC2626;
-            }
-        """)
+        self.btn_cancel.setObjectName("cancelButton")
         self.btn_cancel.clicked.connect(self.cancel_clicked.emit)
         layout.addWidget(self.btn_cancel)
 
@@ -280,18 +256,29 @@ class EmbeddedStatusBar(QWidget):
         self._update_timer = QTimer()
         self._update_timer.timeout.connect(self._update_elapsed)
 
+        # Smoothed throughput (items/s) and the last sample it was taken
+        # from; the ETA is derived from it on each progress tick.
+        self._ema_rate = 0.0
         self._last_current = 0
-        self._last_total = 0
-
-    def show_progress(
-        self, current: int, total: int, status: str, detail: str
-    ):
-        """Show progress information."""
+        self._last_sample_ms = 0
+        # Text currently shown in the timer/ETA labels; the periodic
+        # tick skips setText (and the repaint) when it would not change.
+        self._timer_text = ""
+        self._eta_text = ""
+
+    def set_phase(self, status: str):
+        """Start showing progress for an operation labelled ``status``."""
         self.lbl_status.setText(status)
+        self.show_progress(0, 0, "")
+
+    def show_progress(self, current: int, total: int, detail: str):
+        """Show progress information (matches StepWorker.progress)."""
         self.lbl_detail.setText(detail)
 
-        self._last_current = current
-        self._last_total = total
+        if not self._elapsed_timer.isValid():
+            self._elapsed_timer.start()
+            self._update_timer.start(UI_CONFIG.STATUS_TICK_MS)
+            self._reset_rate()
 
         if total > 0:
             self.progress_bar.setMaximum(total)
@@ -303,103 +290,117 @@ class EmbeddedStatusBar(QWidget):
             self.progress_bar.setMaximum(0)
             self.progress_bar.setVisible(True)
             self.lbl_progress_detail.setText("")
-            self.lbl_eta.setText("")
+            self._set_eta_text("")
 
         self.btn_cancel.setVisible(True)
 
-        if not self._elapsed_timer.isValid():
-            self._elapsed_timer.start()
-            self._update_timer.start(1000)
+    def _set_timer_text(self, text: str):
+        if text != self._timer_text:
+            self._timer_text = text
+            self.lbl_timer.setText(text)
+
+    def _set_eta_text(self, text: str):
+        if text != self._eta_text:
+            self._eta_text = text
+            self.lbl_eta.setText(text)
 
     def _update_elapsed(self):
         """Update elapsed time display."""
         if self._elapsed_timer.isValid():
             elapsed_ms = self._elapsed_timer.elapsed()
-            self.lbl_timer.setText(f"Elapsed: {self._format_time(elapsed_ms)}")
+            self._set_timer_text(
+                f"Elapsed: {self._format_seconds(elapsed_ms // 1000)}"
+            )
 
-            if self._last_total > 0:
-                self._update_eta(self._last_current, self._last_total)
+    def _reset_rate(self):
+        self._ema_rate = 0.0
+        self._last_current = 0
+        self._last_sample_ms = 0
 
     def _update_eta(self, current: int, total: int):
-        """Calculate and update ETA display."""
-        if current <= 0 or not self._elapsed_timer.isValid():
-            self.lbl_eta.setText("")
-            return
-
-        elapsed_ms = self._elapsed_timer.elapsed()
-        if elapsed_ms <= 0:
-            self.lbl_eta.setText("")
-            return
+        """Fold a progress tick into the smoothed rate and show the ETA."""
+        now_ms = self._elapsed_timer.elapsed()
+        if current < self._last_current:
+            # The count restarted (next phase); drop the old rate.
+            self._ema_rate = 0.0
+            self._last_current = current
+            self._last_sample_ms = now_ms
+
+        # Ticks that land in the same millisecond are folded into the
+        # next sample rather than producing an infinite rate.
+        dt_ms = now_ms - self._last_sample_ms
+        if current > self._last_current and dt_ms > 0:
+            instant = (current - self._last_current) * 1000.0 / dt_ms
+            if self._ema_rate:
+                alpha = UI_CONFIG.ETA_SMOOTHING
+                self._ema_rate = alpha * instant + (1 - alpha) * self._ema_rate
+            else:
+                self._ema_rate = instant
+            self._last_current = current
+            self._last_sample_ms = now_ms
 
-        rate = current / (elapsed_ms / 1000.0)
         remaining = total - current
-
-        if rate > 0 and remaining > 0:
-            eta_seconds = remaining / rate
-            eta_ms = int(eta_seconds * 1000)
-            self.lbl_eta.setText(f"ETA: {self._format_time(eta_ms)}")
-        elif remaining <= 0:
-            self.lbl_eta.setText("Finishing...")
+        if remaining <= 0:
+            self._set_eta_text("Finishing...")
+        elif self._ema_rate > 0:
+            eta_seconds = int(remaining / self._ema_rate)
+            self._set_eta_text(f"ETA: {self._format_seconds(eta_seconds)}")
         else:
-            self.lbl_eta.setText("")
-
-    def _format_time(self, milliseconds: int) -> str:
-        """Format milliseconds as MM:SS or HH:MM:SS."""
-        seconds = milliseconds // 1000
-        minutes = seconds // 60
-        hours = minutes // 60
+            self._set_eta_text("")
 
-        seconds = seconds % 60
-        minutes = minutes % 60
-
-        if hours > 0:
+    def _format_seconds(self, seconds: int) -> str:
+        """Format whole seconds as MM:SS or HH:MM:SS."""
+        minutes, seconds = divmod(seconds, 60)
+        hours, minutes = divmod(minutes, 60)
+        if hours:
             return f"{hours:02d}:{minutes:02d}:{seconds:02d}"
-        else:
-            return f"{minutes:02d}:{seconds:02d}"
+        return f"{minutes:02d}:{seconds:02d}"
 
     def finish(self, message: str, success: bool = True):
         """Show completion message."""
         self.lbl_status.setText(message)
         self.lbl_detail.setText("")
         self.lbl_progress_detail.setText("")
-        self.lbl_eta.setText("")
+        self._set_eta_text("")
         self.progress_bar.setVisible(False)
         self.btn_cancel.setVisible(False)
 
-        color = "#059669" if success else "#DC2626"
-        self.lbl_status.setStyleSheet(
-            f"background: transparent; color: {color}; font-weight: 500;"
-        )
+        self._set_status_state("success" if success else "failed")
 
         self._update_timer.stop()
         if self._elapsed_timer.isValid():
             elapsed_ms = self._elapsed_timer.elapsed()
-            self.lbl_timer.setText(
-                f"Completed in: {self._format_time(elapsed_ms)}"
+            self._set_timer_text(
+                f"Completed in: {self._format_seconds(elapsed_ms // 1000)}"
             )
         self._elapsed_timer.invalidate()
 
-        self._last_current = 0
-        self._last_total = 0
+        self._reset_rate()
+
+    def _set_status_state(self, state: str):
+        """Colour the status label via its QSS ``state`` property."""
+        if self.lbl_status.property("state") == state:
+            return
+        self.lbl_status.setProperty("state", state)
+        style = self.lbl_status.style()
+        style.unpolish(self.lbl_status)
+        style.polish(self.lbl_status)
 
     def reset_ui(self):
         """Reset to initial state."""
         self.lbl_status.setText("Ready")
-        self.lbl_status.setStyleSheet(
-            "background: transparent; color: #374151; font-weight: 500;"
-        )
+        self._set_status_state("")
         self.lbl_detail.setText("")
         self.lbl_progress_detail.setText("")
-        self.lbl_timer.setText("")
-        self.lbl_eta.setText("")
+        self._set_timer_text("")
+        self._set_eta_text("")
         self.progress_bar.setVisible(False)
         self.btn_cancel.setVisible(False)
 
         self._update_timer.stop()
         self._elapsed_timer.invalidate()
 
-        self._last_current = 0
-        self._last_total = 0
+        self._reset_rate()
 
     def stop_timer(self):
         """Stop the elapsed timer."""
@@ -425,6 +426,103 @@ class TableContainer(QWidget):
         layout.addWidget(table)
 
 
+# ==============================================================================
+# FILTER CATEGORIES
+# ==============================================================================
+
+
+# One bit per "Show" checkbox. Each row's bit is computed once when data is
+# loaded, so apply_filters tests a row with a single AND against the mask of
+# enabled categories instead of a per-row type lookup and branch.
+(
+    _F_FIELDS, _F_FORMS, _F_STATUSES, _F_USER_FIELDS, _F_ORG_FIELDS,
+    _F_GROUPS, _F_MACROS, _F_TRIGGERS, _F_AUTOMATIONS, _F_VIEWS, _F_SLA,
+    _F_HC_CATS, _F_HC_SECTS, _F_HC_ARTS, _F_RESERVED, _F_OTHER,
+) = (1 << i for i in range(16))
+
+_FILTER_BITS: Dict[str, int] = {
+    'ticket_field': _F_FIELDS,
+    'ticket_field_option': _F_FIELDS,
+    'ticket_form': _F_FORMS,
+    'custom_status': _F_STATUSES,
+    'user_field': _F_USER_FIELDS,
+    'user_field_option': _F_USER_FIELDS,
+    'organization_field': _F_ORG_FIELDS,
+    'organization_field_option': _F_ORG_FIELDS,
+    'group': _F_GROUPS,
+    'macro': _F_MACROS,
+    'trigger': _F_TRIGGERS,
+    'automation': _F_AUTOMATIONS,
+    'view': _F_VIEWS,
+    'sla_policy': _F_SLA,
+    'category': _F_HC_CATS,
+    'section': _F_HC_SECTS,
+    'article': _F_HC_ARTS,
+}
+
+
+def _filter_bit(item: Dict[str, Any]) -> int:
+    """Filter category bit for a work item (unknown types are always shown)."""
+    if item.get('is_system', False):
+        return _F_RESERVED
+    return _FILTER_BITS.get(item.get('type', ''), _F_OTHER)
+
+
+# One bit per SOURCE_* value, so "is this source in group X" is a single
+# AND against a precomputed mask. Unknown sources map to 0 (in no group).
+_SOURCE_BIT: Dict[str, int] = {
+    src: 1 << i for i, src in enumerate((
+        SOURCE_NEW, SOURCE_ZENDESK_DC, SOURCE_TRANSLATED, SOURCE_CACHE,
+        SOURCE_FAILED, SOURCE_MANUAL, SOURCE_ATTENTION, SOURCE_RESERVED,
+    ))
+}
+
+# Sources the "will translate" label treats as already done.
+_DONE_MASK = (
+    _SOURCE_BIT[SOURCE_TRANSLATED] | _SOURCE_BIT[SOURCE_CACHE]
+    | _SOURCE_BIT[SOURCE_MANUAL] | _SOURCE_BIT[SOURCE_ZENDESK_DC]
+)
+# Sources the summary stats count as translated.
+_STATS_TRANSLATED_MASK = (
+    _SOURCE_BIT[SOURCE_TRANSLATED] | _SOURCE_BIT[SOURCE_CACHE]
+    | _SOURCE_BIT[SOURCE_MANUAL] | _SOURCE_BIT[SOURCE_ATTENTION]
+)
+
+# Per-row translation state, kept as a flat list next to the model data so
+# the "will translate" label counts small ints for the selected rows
+# instead of re-reading several dict keys per row.
+_TS_PENDING, _TS_DONE, _TS_SYSTEM = range(3)
+
+
+def _translate_state(item: Dict[str, Any]) -> int:
+    """Translation state code for a work item."""
+    if item.get('is_system', False):
+        return _TS_SYSTEM
+    if (
+        _SOURCE_BIT.get(item.get('en_source', SOURCE_NEW), 0) & _DONE_MASK
+        and _SOURCE_BIT.get(item.get('es_source', SOURCE_NEW), 0) & _DONE_MASK
+    ):
+        return _TS_DONE
+    return _TS_PENDING
+
+
+# ==============================================================================
+# CELL BRUSHES
+# ==============================================================================
+
+
+# The model's colour roles return these shared brushes, so the delegate
+# never wraps a QColor in a fresh QBrush while painting a cell.
+_SOURCE_BRUSHES = {s: QBrush(_get_source_color(s)) for s in SOURCE_COLORS}
+_TEXT_BRUSHES = {s: QBrush(_get_text_color(s)) for s in TEXT_COLORS}
+_PLACEHOLDER_BRUSHES = {
+    s: QBrush(_get_placeholder_color(s)) for s in PLACEHOLDER_COLORS
+}
+_PLACEHOLDER_TEXT_BRUSHES = {
+    s: QBrush(_get_placeholder_text_color(s)) for s in PLACEHOLDER_TEXT_COLORS
+}
+
+
 # ==============================================================================
 # CELL COLOR DELEGATE
 # ==============================================================================
@@ -568,16 +666,27 @@ class WorkItemTableModel(QAbstractTableModel):
     _SRC_KEY = {COL_PT: 'pt_source', COL_EN: 'en_source', COL_ES: 'es_source'}
     _FIELD_KEY = {COL_PT: 'pt', COL_EN: 'en', COL_ES: 'es'}
 
-    # Emitted when a user edits a cell: (data_index, field, value, source)
-    cell_edited = pyqtSignal(int, str, str, str)
-    # Emitted when a checkbox is toggled
-    selection_toggled = pyqtSignal()
+    # Emitted with the new selected-row count whenever checkboxes change
+    selection_count_changed = pyqtSignal(int)
 
     def __init__(self, parent=None):
         super().__init__(parent)
         self._data: List[Dict[str, Any]] = []
-        self._selection: Dict[int, bool] = {}
+        # One byte per row (1 = checked); bulk selection changes and the
+        # selected-row list run over it with C-level helpers.
+        self._selection = bytearray()
+        # Selected row indices, rebuilt lazily after the selection changes.
+        self._selected_rows: Optional[List[int]] = None
+        self._selected_count = 0
+        # Selected rows per translate state (pending, done, system), kept
+        # in step with the selection so the will-translate label is O(1).
+        self._selected_states = [0, 0, 0]
         self._search_cache: Dict[int, str] = {}
+        # Per-row "has both EN and ES" flags, refreshed wherever a row's
+        # text changes so summaries don't re-test the strings.
+        self._complete: List[bool] = []
+        self._filter_bits: List[int] = []
+        self._translate_states: List[int] = []
 
     # ------------------------------------------------------------------
     # Data loading
@@ -590,11 +699,20 @@ class WorkItemTableModel(QAbstractTableModel):
     ):
         self.beginResetModel()
         self._data = data
-        self._selection = selection_state.copy() if selection_state else {}
+        self._selection = bytearray(len(data))
+        for idx, checked in (selection_state or {}).items():
+            if checked and 0 <= idx < len(data):
+                self._selection[idx] = 1
         self._search_cache = {
             i: self._build_search_string(item)
             for i, item in enumerate(data)
         }
+        self._complete = [
+            bool(item.get('en')) and bool(item.get('es')) for item in data
+        ]
+        self._filter_bits = [_filter_bit(item) for item in data]
+        self._translate_states = [_translate_state(item) for item in data]
+        self._recount_selection()
         self.endResetModel()
 
     def update_item(self, data_index: int, item: Dict[str, Any] = None):
@@ -603,9 +721,13 @@ class WorkItemTableModel(QAbstractTableModel):
             return
         if item is not None and item is not self._data[data_index]:
             self._data[data_index].update(item)
-        self._search_cache[data_index] = self._build_search_string(
-            self._data[data_index]
+        row_item = self._data[data_index]
+        self._search_cache[data_index] = self._build_search_string(row_item)
+        self._complete[data_index] = (
+            bool(row_item.get('en')) and bool(row_item.get('es'))
         )
+        self._filter_bits[data_index] = _filter_bit(row_item)
+        self._set_translate_state(data_index, _translate_state(row_item))
         top_left = self.index(data_index, 0)
         bottom_right = self.index(data_index, len(self.COLUMNS) - 1)
         self.dataChanged.emit(top_left, bottom_right)
@@ -662,7 +784,7 @@ class WorkItemTableModel(QAbstractTableModel):
             return item.get(self._FIELD_KEY[col], '') or ''
 
         if role == Qt.ItemDataRole.CheckStateRole and col == self.COL_SELECT:
-            checked = self._selection.get(row, False)
+            checked = self._selection[row]
             return Qt.CheckState.Checked if checked else Qt.CheckState.Unchecked
 
         if role == Qt.ItemDataRole.BackgroundRole:
@@ -690,9 +812,14 @@ class WorkItemTableModel(QAbstractTableModel):
                 value == Qt.CheckState.Checked
                 or (isinstance(value, int) and value == Qt.CheckState.Checked.value)
             )
-            self._selection[row] = checked
+            new = 1 if checked else 0
+            delta = new - self._selection[row]
+            self._selected_count += delta
+            self._selected_states[self._translate_states[row]] += delta
+            self._selection[row] = new
+            self._selected_rows = None
             self.dataChanged.emit(index, index, [Qt.ItemDataRole.CheckStateRole])
-            self.selection_toggled.emit()
+            self.selection_count_changed.emit(self._selected_count)
             return True
 
         if role == Qt.ItemDataRole.EditRole and col in self._FIELD_KEY:
@@ -702,11 +829,12 @@ class WorkItemTableModel(QAbstractTableModel):
             item[field] = value
             item[field + '_source'] = SOURCE_MANUAL
             self._search_cache[row] = self._build_search_string(item)
+            self._complete[row] = bool(item.get('en')) and bool(item.get('es'))
+            self._set_translate_state(row, _translate_state(item))
             self.dataChanged.emit(
                 index, index,
                 [role, Qt.ItemDataRole.BackgroundRole, Qt.ItemDataRole.ForegroundRole],
             )
-            self.cell_edited.emit(row, field, value, SOURCE_MANUAL)
             return True
 
         return False
@@ -741,12 +869,13 @@ class WorkItemTableModel(QAbstractTableModel):
             src = SOURCE_RESERVED if is_system else item.get(
                 self._SRC_KEY[col], SOURCE_NEW
             )
-            return _get_source_color(src)
+            return _SOURCE_BRUSHES.get(src, _SOURCE_BRUSHES[SOURCE_NEW])
         if col == self.COL_PLACEHOLDER:
             ph = item.get('dc_placeholder', '') or ''
             if ph:
-                return _get_placeholder_color(
-                    item.get('placeholder_source', 'proposed')
+                return _PLACEHOLDER_BRUSHES.get(
+                    item.get('placeholder_source', 'proposed'),
+                    _PLACEHOLDER_BRUSHES['proposed'],
                 )
         return None
 
@@ -755,15 +884,16 @@ class WorkItemTableModel(QAbstractTableModel):
             src = SOURCE_RESERVED if is_system else item.get(
                 self._SRC_KEY[col], SOURCE_NEW
             )
-            return _get_text_color(src)
+            return _TEXT_BRUSHES.get(src, _TEXT_BRUSHES[SOURCE_NEW])
         if col == self.COL_PLACEHOLDER:
             ph = item.get('dc_placeholder', '') or ''
             if ph:
-                return _get_placeholder_text_color(
-                    item.get('placeholder_source', 'proposed')
+                return _PLACEHOLDER_TEXT_BRUSHES.get(
+                    item.get('placeholder_source', 'proposed'),
+                    _PLACEHOLDER_TEXT_BRUSHES['proposed'],
                 )
         if col == self.COL_ACTION and is_system:
-            return _get_text_color(SOURCE_RESERVED)
+            return _TEXT_BRUSHES[SOURCE_RESERVED]
         return None
 
     def _tooltip(self, col, item, is_system):
@@ -808,19 +938,61 @@ class WorkItemTableModel(QAbstractTableModel):
     # ------------------------------------------------------------------
 
     def get_selected_count(self) -> int:
-        return sum(1 for v in self._selection.values() if v)
+        return self._selected_count
 
     def get_selected_rows(self) -> List[int]:
-        return [idx for idx, sel in self._selection.items() if sel]
+        """Selected row indices. The list is cached until the selection
+        changes, so callers must not modify it."""
+        if self._selected_rows is None:
+            self._selected_rows = list(
+                compress(range(len(self._selection)), self._selection)
+            )
+        return self._selected_rows
 
     def get_selection_state(self) -> Dict[int, bool]:
-        return self._selection.copy()
+        return dict.fromkeys(self.get_selected_rows(), True)
+
+    def is_complete(self, row: int) -> bool:
+        return 0 <= row < len(self._complete) and self._complete[row]
+
+    def selected_translate_states(self) -> Tuple[int, int, int]:
+        """Return (pending, done, system) counts for the selected rows."""
+        counts = self._selected_states
+        return counts[_TS_PENDING], counts[_TS_DONE], counts[_TS_SYSTEM]
+
+    def _set_translate_state(self, row: int, state: int):
+        old = self._translate_states[row]
+        if state != old:
+            self._translate_states[row] = state
+            if self._selection[row]:
+                self._selected_states[old] -= 1
+                self._selected_states[state] += 1
+
+    def _recount_selection(self):
+        """Recount the selection totals after a bulk change."""
+        self._selected_rows = None
+        self._selected_count = self._selection.count(1)
+        # Counter over compress() tallies in C rather than a bytecode loop.
+        counts = Counter(compress(self._translate_states, self._selection))
+        self._selected_states = [
+            counts[_TS_PENDING], counts[_TS_DONE], counts[_TS_SYSTEM]
+        ]
+
+    def count_ready(self, rows: List[int]) -> Tuple[int, int]:
+        """Return (non-system, ready to apply) counts for the given rows."""
+        states = self._translate_states
+        rows = [
+            row for row in rows
+            if row < len(states) and states[row] != _TS_SYSTEM
+        ]
+        return len(rows), sum(map(self._complete.__getitem__, rows))
 
     def _emit_selection_range(self, indices: List[int]):
         """Emit dataChanged in contiguous blocks to avoid invalidating rows
         that were not actually changed (e.g. sparse filtered selections)."""
         if not indices:
             return
+        self._recount_selection()
         sorted_idx = sorted(indices)
         role = [Qt.ItemDataRole.CheckStateRole]
         block_start = sorted_idx[0]
@@ -839,7 +1011,7 @@ class WorkItemTableModel(QAbstractTableModel):
             self.index(prev, self.COL_SELECT),
             role,
         )
-        self.selection_toggled.emit()
+        self.selection_count_changed.emit(self._selected_count)
 
 
 # ==============================================================================
@@ -855,7 +1027,6 @@ class PreviewTableWidget(QTableView):
     """
 
     stats_updated = pyqtSignal(dict)
-    cell_edited = pyqtSignal(int, str, str, str)
     selection_changed = pyqtSignal(int)
     loading_finished = pyqtSignal()
 
@@ -865,11 +1036,11 @@ class PreviewTableWidget(QTableView):
         super().__init__(parent)
 
         self._model = WorkItemTableModel(self)
-        self._model.cell_edited.connect(self.cell_edited)
-        self._model.selection_toggled.connect(
-            lambda: self.selection_changed.emit(self._model.get_selected_count())
-        )
+        self._model.selection_count_changed.connect(self.selection_changed)
         self.setModel(self._model)
+        # Mirrors the view's hidden rows (1 = shown) so bulk operations need
+        # not ask the view about each row; resynced from it on every load.
+        self._visible = bytearray()
         self._setup_view()
 
     # ------------------------------------------------------------------
@@ -936,6 +1107,12 @@ class PreviewTableWidget(QTableView):
         """Load data into the model.  QTableView virtualises rendering so
         no timer-based batching is needed."""
         self._model.load_data(data, selection_state)
+        # QTableView keeps rows hidden across a model reset, so take the
+        # mask from the view itself rather than assuming every row shows.
+        is_hidden = self.isRowHidden
+        self._visible = bytearray(
+            not is_hidden(row) for row in range(len(data))
+        )
         self._update_stats()
         # Defer loading_finished so callers can connect after this call
         QTimer.singleShot(0, self.loading_finished.emit)
@@ -949,24 +1126,14 @@ class PreviewTableWidget(QTableView):
 
     def _update_stats(self):
         data = self._model._data
-        stats = {
-            'total': len(data),
-            'items_from_dc': 0,
-            'items_translated': 0,
-            'items_failed': 0,
-            'items_attention': 0,
-            'items_reserved': 0,
-            'items_pending': 0,
-            'selected_count': self._model.get_selected_count(),
-        }
-
-        translated_sources = frozenset({
-            SOURCE_TRANSLATED, SOURCE_CACHE, SOURCE_MANUAL, SOURCE_ATTENTION,
-        })
+        source_bit = _SOURCE_BIT
 
+        # Count into locals and build the stats dict once, rather than
+        # hashing a dict key on every increment.
+        from_dc = translated = failed = attention = reserved = pending = 0
         for item in data:
             if item.get('is_system', False):
-                stats['items_reserved'] += 1
+                reserved += 1
                 continue
 
             source = item.get('source', SOURCE_NEW)
@@ -974,20 +1141,29 @@ class PreviewTableWidget(QTableView):
             es_source = item.get('es_source', SOURCE_NEW)
 
             if source == SOURCE_ZENDESK_DC:
-                stats['items_from_dc'] += 1
+                from_dc += 1
             elif en_source == SOURCE_FAILED or es_source == SOURCE_FAILED:
-                stats['items_failed'] += 1
+                failed += 1
             elif en_source == SOURCE_ATTENTION or es_source == SOURCE_ATTENTION:
-                stats['items_attention'] += 1
+                attention += 1
             elif (
-                en_source in translated_sources
-                and es_source in translated_sources
+                source_bit.get(en_source, 0) & _STATS_TRANSLATED_MASK
+                and source_bit.get(es_source, 0) & _STATS_TRANSLATED_MASK
             ):
-                stats['items_translated'] += 1
+                translated += 1
             else:
-                stats['items_pending'] += 1
+                pending += 1
 
-        self.stats_updated.emit(stats)
+        self.stats_updated.emit({
+            'total': len(data),
+            'items_from_dc': from_dc,
+            'items_translated': translated,
+            'items_failed': failed,
+            'items_attention': attention,
+            'items_reserved': reserved,
+            'items_pending': pending,
+            'selected_count': self._model.get_selected_count(),
+        })
 
     # ------------------------------------------------------------------
     # Filtering
@@ -1012,46 +1188,50 @@ class PreviewTableWidget(QTableView):
         show_reserved: bool = True,
         search_text: str = '',
     ):
-        TYPE_VISIBLE = {
-            'ticket_field': show_fields,
-            'ticket_field_option': show_fields,
-            'ticket_form': show_forms,
-            'custom_status': show_statuses,
-            'user_field': show_user_fields,
-            'user_field_option': show_user_fields,
-            'organization_field': show_org_fields,
-            'organization_field_option': show_org_fields,
-            'group': show_groups,
-            'macro': show_macros,
-            'trigger': show_triggers,
-            'automation': show_automations,
-            'view': show_views,
-            'sla_policy': show_sla,
-            'category': show_hc_cats,
-            'section': show_hc_sects,
-            'article': show_hc_arts,
-        }
+        allowed = _F_OTHER
+        for enabled, bit in (
+            (show_fields, _F_FIELDS),
+            (show_forms, _F_FORMS),
+            (show_statuses, _F_STATUSES),
+            (show_user_fields, _F_USER_FIELDS),
+            (show_org_fields, _F_ORG_FIELDS),
+            (show_groups, _F_GROUPS),
+            (show_macros, _F_MACROS),
+            (show_triggers, _F_TRIGGERS),
+            (show_automations, _F_AUTOMATIONS),
+            (show_views, _F_VIEWS),
+            (show_sla, _F_SLA),
+            (show_hc_cats, _F_HC_CATS),
+            (show_hc_sects, _F_HC_SECTS),
+            (show_hc_arts, _F_HC_ARTS),
+            (show_reserved, _F_RESERVED),
+        ):
+            if enabled:
+                allowed |= bit
 
         search = search_text.strip().lower()
-
-        for row in range(self._model.rowCount()):
-            item = self._model._data[row]
-            is_system = item.get('is_system', False)
-
-            if is_system:
-                type_visible = show_reserved
-            else:
-                type_visible = TYPE_VISIBLE.get(item.get('type', ''), True)
-
-            if not type_visible:
-                self.setRowHidden(row, True)
-                continue
-
-            if search:
-                searchable = self._model._search_cache.get(row, '')
-                self.setRowHidden(row, search not in searchable)
-            else:
-                self.setRowHidden(row, False)
+        search_cache = self._model._search_cache
+
+        filter_bits = self._model._filter_bits
+        previous = self._visible
+        if len(previous) != len(filter_bits):
+            # Mask out of step with the model: resync every row from the
+            # view instead of trusting it.
+            is_hidden = self.isRowHidden
+            previous = bytearray(
+                not is_hidden(row) for row in range(len(filter_bits))
+            )
+        visible = bytearray(len(filter_bits))
+        for row, bit in enumerate(filter_bits):
+            shown = bool(bit & allowed) and (
+                not search or search in search_cache.get(row, '')
+            )
+            visible[row] = shown
+            # Only touch the view for rows whose visibility flips; a filter
+            # change usually leaves most rows as they were.
+            if shown != previous[row]:
+                self.setRowHidden(row, not shown)
+        self._visible = visible
 
     # ------------------------------------------------------------------
     # Selection
@@ -1066,39 +1246,44 @@ class PreviewTableWidget(QTableView):
     def get_selection_state(self) -> Dict[int, bool]:
         return self._model.get_selection_state()
 
+    def is_row_complete(self, row: int) -> bool:
+        """True if the row has both EN and ES text."""
+        return self._model.is_complete(row)
+
+    def selected_translate_states(self) -> Tuple[int, int, int]:
+        """Return (pending, done, system) counts for the selected rows."""
+        return self._model.selected_translate_states()
+
+    def count_ready(self, rows: List[int]) -> Tuple[int, int]:
+        """Return (non-system, ready to apply) counts for the given rows."""
+        return self._model.count_ready(rows)
+
+    def _visible_rows(self, skip_system: bool) -> List[int]:
+        rows = compress(range(len(self._visible)), self._visible)
+        if not skip_system:
+            return list(rows)
+        states = self._model._translate_states
+        return [row for row in rows if states[row] != _TS_SYSTEM]
+
     def select_all_visible(self):
-        changed = []
-        for row in range(self._model.rowCount()):
-            if self.isRowHidden(row):
-                continue
-            item = self._model._data[row]
-            if item.get('is_system', False):
-                continue
-            self._model._selection[row] = True
-            changed.append(row)
+        changed = self._visible_rows(skip_system=True)
+        selection = self._model._selection
+        for row in changed:
+            selection[row] = 1
         self._model._emit_selection_range(changed)
 
     def deselect_all_visible(self):
-        changed = []
-        for row in range(self._model.rowCount()):
-            if self.isRowHidden(row):
-                continue
-            self._model._selection[row] = False
-            changed.append(row)
+        changed = self._visible_rows(skip_system=False)
+        selection = self._model._selection
+        for row in changed:
+            selection[row] = 0
         self._model._emit_selection_range(changed)
 
     def invert_selection_visible(self):
-        changed = []
-        for row in range(self._model.rowCount()):
-            if self.isRowHidden(row):
-                continue
-            item = self._model._data[row]
-            if item.get('is_system', False):
-                continue
-            self._model._selection[row] = not self._model._selection.get(
-                row, False
-            )
-            changed.append(row)
+        changed = self._visible_rows(skip_system=True)
+        selection = self._model._selection
+        for row in changed:
+            selection[row] ^= 1
         self._model._emit_selection_range(changed)
 
     # ------------------------------------------------------------------
@@ -1123,10 +1308,7 @@ class PreviewTableWidget(QTableView):
         self._model.update_item(row, item)
 
     def get_visible_data_indices(self) -> List[int]:
-        return [
-            row for row in range(self._model.rowCount())
-            if not self.isRowHidden(row)
-        ]
+        return self._visible_rows(skip_system=False)
 
     def get_visible_selected_indices(self) -> List[int]:
         visible = set(self.get_visible_data_indices())